@@ -23,6 +23,18 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
 
+    # Connection pool (per server process). Sync endpoints run on AnyIO's
+    # 40-thread pool, so pool_size + max_overflow = 50 covers every thread
+    # plus the event loop's executor work without queuing for a connection.
+    # Keep workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) below Postgres'
+    # max_connections.
+    DB_POOL_SIZE: int = 25
+    DB_MAX_OVERFLOW: int = 25
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    # Fail fast with a 500 when the pool is exhausted instead of holding the
+    # request (and its worker thread) for SQLAlchemy's default 30 seconds
+    DB_POOL_TIMEOUT_SECONDS: int = 5
+
     # Environment
     ENVIRONMENT: str
     DEBUG: bool
@@ -57,6 +69,9 @@ class Settings(BaseSettings):
     OLLAMA_MODEL: str
     OLLAMA_TIMEOUT: int
 
+    # File Uploads
+    MAX_PDF_UPLOAD_BYTES: int = 10 * 1024 * 1024  # 10 MB
+
     @property
     def is_production(self) -> bool:
         """Check if running in production environment."""
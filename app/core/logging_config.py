@@ -11,10 +11,14 @@ Educational Focus:
 - Performance monitoring through logs
 """
 
+import atexit
+import copy
 import json
 import logging
 import logging.config
+import logging.handlers
 import os
+import queue
 import sys
 import time
 from contextvars import ContextVar
@@ -66,19 +70,22 @@ class EnhancedJSONFormatter(logging.Formatter):
             "service": "better-call-buffet",
         }
 
-        # Add request context if available
-        request_id = request_id_var.get()
+        # Add request context if available. Records formatted on the queue
+        # listener thread carry the context captured by ContextQueueHandler
+        request_id = getattr(record, "request_id", None) or request_id_var.get()
         if request_id:
             log_entry["request_id"] = request_id
 
-        user_id = user_id_var.get()
+        user_id = getattr(record, "user_id", None) or user_id_var.get()
         if user_id:
             log_entry["user_id"] = user_id
 
         # Add performance information
-        start_time = request_start_time_var.get()
+        start_time = getattr(record, "request_start_time", None)
+        if start_time is None:
+            start_time = request_start_time_var.get()
         if start_time is not None:
-            duration_ms = round((time.time() - start_time) * 1000, 2)
+            duration_ms = round((record.created - start_time) * 1000, 2)
             log_entry["duration_ms"] = duration_ms
 
         # Add exception information if present
@@ -92,6 +99,74 @@ class EnhancedJSONFormatter(logging.Formatter):
         return json.dumps(log_entry, default=str)
 
 
+# ============================================================================
+# 🎓 NON-BLOCKING HANDLER
+# ============================================================================
+
+
+class ContextQueueHandler(logging.handlers.QueueHandler):
+    """
+    🎓 QueueHandler that snapshots the request context onto each record.
+
+    Educational Note:
+    Context variables are per-thread/task, so the listener thread that formats
+    the record cannot see them; they are copied onto the record while still in
+    the logging thread.
+
+    Unlike the base class, the record is not formatted here: the queue never
+    leaves the process, so exc_info can travel as-is and the real handler's
+    formatter (e.g. EnhancedJSONFormatter's "exception" field) still sees it.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.request_id = request_id_var.get()
+        record.user_id = user_id_var.get()
+        record.request_start_time = request_start_time_var.get()
+        return record
+
+
+# Started once by setup_logging; drains the queue into the real handlers
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _move_root_handlers_behind_queue() -> None:
+    """
+    🎓 Put the root handlers behind a queue drained by a background thread.
+
+    Educational Note:
+    Logging calls (e.g. inside the PDF extraction loop) then only enqueue the
+    record; formatting and the write to stdout happen off the request thread.
+    """
+    global _queue_listener
+    _stop_queue_listener()
+
+    root = logging.getLogger()
+    handlers = [h for h in root.handlers if not isinstance(h, ContextQueueHandler)]
+    log_queue: queue.Queue = queue.Queue(-1)
+
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(ContextQueueHandler(log_queue))
+
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued records (on reconfiguration and interpreter shutdown)"""
+    global _queue_listener
+    if _queue_listener is not None:
+        # A stopped listener cannot be stopped again
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 # ============================================================================
 # 🎓 LOGGING CONFIGURATION
 # ============================================================================
@@ -146,6 +221,7 @@ def setup_logging(environment: str = "development", log_level: str = "INFO") ->
 
     # Apply logging configuration
     logging.config.dictConfig(logging_config)
+    _move_root_handlers_behind_queue()
 
     # Configure structlog
     structlog.configure(
@@ -6,12 +6,15 @@ like date parsing, number conversion, and data validation.
 """
 
 from .date import safe_parse_date, safe_parse_datetime
+from .http_cache import build_etag, etag_matches
+from .ids import uuid7
 from .numbers import (
     format_currency,
     safe_parse_decimal,
     safe_parse_float,
     safe_parse_int,
 )
+from .pagination import decode_cursor, encode_cursor
 
 __all__ = [
     # Date utilities
@@ -22,4 +25,12 @@ __all__ = [
     "safe_parse_int",
     "safe_parse_decimal",
     "format_currency",
+    # HTTP cache utilities
+    "build_etag",
+    "etag_matches",
+    # Pagination utilities
+    "encode_cursor",
+    "decode_cursor",
+    # Id utilities
+    "uuid7",
 ]
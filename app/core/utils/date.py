@@ -1,11 +1,18 @@
-import calendar
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
+# Days per month in a common year (February gains a day in leap years)
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
 
+
+@lru_cache(maxsize=4096)
 def add_months(source_date: date, months: int) -> date:
     """
     Add months to a date, handling end-of-month overflow.
+
+    Pure and called with the same few (due date, step) pairs across all of a
+    user's subscriptions and forecast months, so results are memoized.
     
     Logic:
     1. Calculate the target year and month.
@@ -16,13 +23,21 @@ def add_months(source_date: date, months: int) -> date:
     new_year = source_date.year + (source_date.month + months - 1) // 12
     new_month = (source_date.month + months - 1) % 12 + 1
     
-    # 2. Get the last valid day of that new month
-    _, last_day_of_month = calendar.monthrange(new_year, new_month)
-    
+    # Every month has at least 28 days: no clamping needed
+    day = source_date.day
+    if day <= 28:
+        return date(new_year, new_month, day)
+
+    # 2. Get the last valid day of that new month (plain arithmetic instead
+    # of calendar.monthrange, which also computes the unused weekday)
+    last_day_of_month = _DAYS_IN_MONTH[new_month - 1]
+    if new_month == 2 and new_year % 4 == 0 and (
+        new_year % 100 != 0 or new_year % 400 == 0
+    ):
+        last_day_of_month = 29
+
     # 3. Determine the new day
-    new_day = min(source_date.day, last_day_of_month)
-    
-    return date(new_year, new_month, new_day)
+    return date(new_year, new_month, min(day, last_day_of_month))
 
 
 def safe_parse_date(
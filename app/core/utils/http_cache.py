@@ -0,0 +1,35 @@
+import hashlib
+from typing import Any, Optional
+
+
+def build_etag(*parts: Any) -> str:
+    """
+    🎓 Build a weak ETag from the values that version a response.
+
+    Args:
+        *parts: Values that change whenever the response body changes
+            (ids, updated_at timestamps, totals, serialized filters...)
+
+    Returns:
+        Weak ETag header value, e.g. W/"3f2a9c1e0b7d4e55"
+    """
+    digest = hashlib.sha1("|".join(map(str, parts)).encode()).hexdigest()[:16]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    🎓 Check an If-None-Match request header against the current ETag.
+
+    Args:
+        if_none_match: Raw If-None-Match header value or None
+        etag: ETag of the current representation
+
+    Returns:
+        True if the client's cached copy is still valid (respond with 304)
+    """
+    if not if_none_match:
+        return False
+
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
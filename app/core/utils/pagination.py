@@ -0,0 +1,41 @@
+import base64
+from typing import Any, List
+
+
+def encode_cursor(*parts: Any) -> str:
+    """
+    🎓 Build an opaque keyset-pagination cursor from the last row's sort key.
+
+    Args:
+        *parts: Sort key values of the last row on the page (e.g. due date, id)
+
+    Returns:
+        URL-safe cursor string, e.g. "MjAyNi0wMS0xNXwzZjJh..."
+    """
+    raw = "|".join(map(str, parts)).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[str]:
+    """
+    🎓 Split a cursor built by encode_cursor back into its sort key values.
+
+    Args:
+        cursor: Cursor string received from the client
+        size: Number of values the cursor must contain
+
+    Returns:
+        The sort key values, as strings
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        parts = base64.urlsafe_b64decode(padded.encode()).decode().split("|")
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+    if len(parts) != size:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return parts
@@ -17,7 +17,18 @@ def get_engine():
     """
     global _engine
     if _engine is None:
-        _engine = create_engine(get_settings().DATABASE_URL)
+        settings = get_settings()
+        _engine = create_engine(
+            settings.DATABASE_URL,
+            # Sized for the server's worker threads (see Settings.DB_POOL_SIZE)
+            # instead of SQLAlchemy's default of 5 + 10 overflow
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+            # Drop connections the server or a proxy closed while idle
+            pool_pre_ping=True,
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        )
     return _engine
 
 
@@ -26,6 +37,10 @@ def get_db_session():
     Dependency injection function for FastAPI routes.
 
     Creates a new database session for each request.
+
+    Routes using it stay sync `def` endpoints: FastAPI runs them in its
+    threadpool, so blocking SQLAlchemy calls never stall the event loop
+    (an `async def` route calling this session would).
     """
     SessionLocal = get_session_local()  # Get SessionLocal factory lazily
     db = SessionLocal()
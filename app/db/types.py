@@ -0,0 +1,30 @@
+from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.types import TypeDecorator
+
+
+class PreSerializedJSON(TypeDecorator):
+    """
+    JSON column that also accepts an already-serialized JSON document.
+
+    Lets callers store pydantic's `model_dump_json()` output (serialized by
+    pydantic-core) as-is instead of a dict that SQLAlchemy would serialize
+    again with json.dumps. Reads still return decoded Python objects.
+
+    Note: any `str` value is treated as serialized JSON, so a bare JSON string
+    scalar must be passed already quoted.
+    """
+
+    impl = JSON
+    cache_ok = True
+
+    def bind_processor(self, dialect):
+        impl_processor = self.impl_instance.bind_processor(dialect)
+        if impl_processor is None:
+            return None
+
+        def process(value):
+            if isinstance(value, str):
+                return value
+            return impl_processor(value)
+
+        return process
@@ -2,7 +2,15 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+)
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_current_user_id, get_ai_client
@@ -16,12 +24,12 @@ from app.domains.accounts.schemas import (
 from app.domains.accounts.service import AccountService
 from app.domains.balance_points.schemas import BalancePoint, BalanceSnapshotIn
 from app.domains.balance_points.service import BalancePointService
+from app.domains.statements import router as statements_router
 from app.domains.statements.schemas import (
     StatementIn,
     StatementResponse,
     StatementListResponse,
 )
-from app.domains.statements.service import StatementService
 from app.domains.transactions.schemas import TransactionFilters, TransactionListResponse
 from app.domains.transactions.service import TransactionService
 from app.core.ai import AIClient
@@ -196,6 +204,12 @@ def get_account_transactions_endpoint(
     sort_order: Optional[str] = Query(
         "desc", description="Sort order: desc (newest first) or asc"
     ),
+    with_total: bool = Query(
+        True, description="Count all matches (false: meta.total is null, faster)"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="meta.next_cursor of the previous page (overrides page)"
+    ),
     db: Session = Depends(get_db_session),
     current_user_id: UUID = Depends(get_current_user_id),
 ):
@@ -223,14 +237,14 @@ def get_account_transactions_endpoint(
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
 
-    try:
-        # Handle comma-separated values for movement_type if passed as a single string in a list
-        final_movement_type = None
-        if movement_type:
-            final_movement_type = []
-            for mt in movement_type:
-                final_movement_type.extend([t.strip() for t in mt.split(",")])
+    # Handle comma-separated values for movement_type if passed as a single string in a list
+    final_movement_type = None
+    if movement_type:
+        final_movement_type = []
+        for mt in movement_type:
+            final_movement_type.extend([t.strip() for t in mt.split(",")])
 
+    try:
         transaction_filters = TransactionFilters(
             page=page,
             per_page=per_page,
@@ -244,7 +258,14 @@ def get_account_transactions_endpoint(
             is_paid=is_paid,
             sort_by=sort_by,
             sort_order=sort_order,
+            with_total=with_total,
+            cursor=cursor,
         )
+    except ValueError:
+        # Malformed cursor
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    try:
         transaction_service = TransactionService(db)
         return transaction_service.get_account_transactions_with_filters(
             account_id=account_id,
@@ -275,6 +296,7 @@ def deactivate_account_endpoint(
 @router.get("/{account_id}/statements", response_model=StatementListResponse)
 def get_account_statements_endpoint(
     account_id: UUID,
+    request: Request,
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page (max 100)"),
     is_processed: Optional[bool] = Query(
@@ -285,47 +307,33 @@ def get_account_statements_endpoint(
     date_to: Optional[datetime] = Query(None, description="Filter to this date"),
     sort_by: Optional[str] = Query("created_at", description="Sort field"),
     sort_order: Optional[str] = Query("desc", description="Sort order: desc or asc"),
+    with_total: bool = Query(
+        True, description="Count all matches (false: meta.total is null, faster)"
+    ),
     db: Session = Depends(get_db_session),
     current_user_id: UUID = Depends(get_current_user_id),
 ):
     """
     Get paginated statements for a specific account.
 
-    Can filter by processing status, date range, and more.
+    Account-scoped alias of `GET /statements?account_id=...`; the statements
+    router owns the implementation.
     """
-    # First verify the account exists and belongs to the user
-    account_service = AccountService(db)
-    account = account_service.get_account_by_id(
-        account_id=account_id, user_id=current_user_id
+    return statements_router.get_statements_endpoint(
+        request=request,
+        account_id=account_id,
+        is_processed=is_processed,
+        is_deleted=is_deleted,
+        date_from=date_from,
+        date_to=date_to,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        page=page,
+        per_page=per_page,
+        with_total=with_total,
+        db=db,
+        user_id=current_user_id,
     )
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found")
-
-    try:
-        from app.domains.statements.schemas import StatementFilters
-
-        filters = StatementFilters(
-            account_id=account_id,
-            is_processed=is_processed,
-            is_deleted=is_deleted,
-            date_from=date_from,
-            date_to=date_to,
-            sort_by=sort_by,
-            sort_order=sort_order,
-            page=page,
-            per_page=per_page,
-        )
-
-        statement_service = StatementService(db)
-        return statement_service.get_account_statements_with_filters(
-            account_id=account_id,
-            user_id=current_user_id,
-            filters=filters,
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Error retrieving statements: {str(e)}"
-        )
 
 
 @router.post(
@@ -340,20 +348,13 @@ def create_account_statement_endpoint(
     """
     Create a new statement for a specific account.
 
-    Processes raw statement data including transactions, balances, and due dates.
     The account_id from the URL path takes precedence over the one in the request body.
     """
-    try:
-        # Override account_id from path parameter to ensure consistency
-        statement_in.account_id = account_id
-
-        service = StatementService(db)
-        statement = service.create_statement(statement_in, current_user_id)
-        return StatementResponse.model_validate(statement)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Error creating statement")
+    # Override account_id from path parameter to ensure consistency
+    statement_in.account_id = account_id
+    return statements_router.create_statement_endpoint(
+        statement_in=statement_in, db=db, user_id=current_user_id
+    )
 
 
 @router.post(
@@ -368,47 +369,11 @@ async def parse_account_statement_pdf_endpoint(
     user_id: UUID = Depends(get_current_user_id),
     ai_client: AIClient = Depends(get_ai_client),
 ):
-    try:
-        # Validate file type
-        if not file.filename or not file.filename.lower().endswith(".pdf"):
-            raise HTTPException(status_code=400, detail="File must be a PDF")
-
-        if not file.content_type or file.content_type != "application/pdf":
-            raise HTTPException(status_code=400, detail="Invalid file type")
-
-        # Validate account ownership
-        account_service = AccountService(db)
-        account = account_service.get_account_by_id(account_id, user_id)
-        if not account:
-            raise HTTPException(status_code=404, detail="Account not found")
-
-        # Read PDF file
-        pdf_content = await file.read()
-
-        # Process PDF and create statement (with transactions!)
-        service = StatementService(db, ai_client)
-        statement = await service.parse_pdf_and_create_statement(
-            pdf_content=pdf_content,
-            filename=file.filename,
-            account_id=account_id,
-            user_id=user_id,
-        )
-
-        return StatementResponse.model_validate(statement)
-
-    except HTTPException:
-        raise  # Re-raise HTTP exceptions as-is
-    except Exception as e:
-        from app.core.logging_config import get_logger
-
-        logger = get_logger(__name__)
-        logger.error(
-            f"PDF parsing failed: {str(e)}",
-            extra={
-                "user_id": str(user_id),
-                "account_id": str(account_id),
-                "filename": file.filename if file.filename else "unknown",
-                "error": str(e),
-            },
-        )
-        raise HTTPException(status_code=500, detail=f"PDF parsing failed: {str(e)}")
+    """Account-scoped alias of `POST /statements/parse-pdf`."""
+    return await statements_router.parse_pdf_statement_endpoint(
+        file=file,
+        account_id=account_id,
+        db=db,
+        user_id=user_id,
+        ai_client=ai_client,
+    )
@@ -18,17 +18,40 @@ from app.domains.balance_points.service import BalancePointService
 
 logger = logging.getLogger(__name__)
 
+# Key under which owned-account lookups are memoized in ``Session.info``.
+# The session lives for exactly one request, so the memo is request-scoped.
+OWNED_ACCOUNTS_CACHE_KEY = "owned_accounts"
+
 
 class AccountService:
 
     def __init__(self, db: Session):
+        self.db = db
         self.repository = AccountRepository(db)
         self.balance_point_service = BalancePointService(db)
 
+    def get_owned_account(self, account_id: UUID, user_id: UUID) -> Optional[Account]:
+        """
+        Ownership check: return the account if it belongs to the user.
+
+        Skips the balance calculation and memoizes the lookup on the request's
+        DB session, so every service sharing the session (statements,
+        transactions, ...) pays for at most one query per (account, user).
+        """
+        cache = self.db.info.setdefault(OWNED_ACCOUNTS_CACHE_KEY, {})
+        key = (account_id, user_id)
+        if key not in cache:
+            cache[key] = self.repository.get_by_id_and_user(account_id, user_id)
+        return cache[key]
+
+    def _invalidate_owned_account(self, account_id: UUID, user_id: UUID) -> None:
+        cache = self.db.info.get(OWNED_ACCOUNTS_CACHE_KEY, {})
+        cache.pop((account_id, user_id), None)
+
     def get_account_by_id(
         self, account_id: UUID, user_id: UUID
     ) -> Optional[AccountWithBalance]:
-        account = self.repository.get_by_id_and_user(account_id, user_id)
+        account = self.get_owned_account(account_id, user_id)
         if account:
             balance = (
                 self.balance_point_service.calculate_account_balance_from_transactions(
@@ -142,6 +165,7 @@ class AccountService:
         if not account:
             return None
 
+        self._invalidate_owned_account(account_id, user_id)
         return self.repository.update(account, {"balance": new_balance})
 
     def deactivate_account(self, account_id: UUID, user_id: UUID) -> Optional[Account]:
@@ -159,6 +183,7 @@ class AccountService:
         if not account:
             return None
 
+        self._invalidate_owned_account(account_id, user_id)
         return self.repository.soft_delete(account)
 
     def get_user_total_balance(self, user_id: UUID) -> float:
@@ -7,8 +7,6 @@ from sqlalchemy.orm import Session
 
 from app.domains.balance_points.repository import BalancePointRepository
 from app.domains.transactions.repository import TransactionRepository
-from app.domains.transactions.models import Transaction
-from app.domains.transactions.constants import MovementType
 
 
 class BalancePointService:
@@ -37,15 +35,6 @@ class BalancePointService:
         # Will be implemented in Phase 3 when we build timeline calculation
         return Decimal('0.00')
 
-    def group_transactions_by_date(self, transactions: List[Transaction]) -> Dict[date, List[Transaction]]:
-        transactions_by_date = {}
-        for transaction in transactions:
-            date = transaction.date.date()
-            if date not in transactions_by_date:
-                transactions_by_date[date] = []
-            transactions_by_date[date].append(transaction)
-        return transactions_by_date
-
     def calculate_balance_timeline(
         self, account_id: UUID, user_id: UUID, start_date: date, end_date: date,
     ) -> List[Dict[str, Any]]:
@@ -54,20 +43,19 @@ class BalancePointService:
         """
 
         previous_balance = self.transaction_repository.get_balance_before_date(account_id, user_id, start_date)
-        transactions= self.transaction_repository.get_transactions_for_timeline(account_id, user_id, start_date, end_date)
-        transactions_by_date = self.group_transactions_by_date(transactions)
+        # Per-day sums come from the database; days without transactions
+        # are missing and keep the balance unchanged
+        movements_by_date = self.transaction_repository.get_daily_balance_movements(
+            account_id, user_id, start_date, end_date
+        )
 
         current_balance = previous_balance
         balance_points = []
 
         for date in self.date_range_iterator(start_date, end_date):
-            transactions_of_day = transactions_by_date.get(date, [])
-
-            summed_transactions_of_day = sum(
-                transaction.amount if transaction.movement_type in [MovementType.INCOME, MovementType.INVESTMENT] else -transaction.amount
-                for transaction in transactions_of_day
-            )
-            current_balance += summed_transactions_of_day
+            movement = movements_by_date.get(date)
+            if movement:
+                current_balance += movement
 
             # Return plain dict - FastAPI will convert to Pydantic schema
             balance_points.append({
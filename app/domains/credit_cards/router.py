@@ -485,6 +485,12 @@ def get_credit_card_transactions_endpoint(
     sort_order: Optional[str] = Query(
         "desc", description="Sort order: desc (newest first) or asc"
     ),
+    with_total: bool = Query(
+        True, description="Count all matches (false: meta.total is null, faster)"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="meta.next_cursor of the previous page (overrides page)"
+    ),
     # Dependencies
     db: Session = Depends(get_db_session),
     current_user_id: UUID = Depends(get_current_user_id),
@@ -535,20 +541,26 @@ def get_credit_card_transactions_endpoint(
             final_movement_type.extend([t.strip() for t in mt.split(",")])
 
     # Create structured filters from query parameters
-    transaction_filters = TransactionFilters(
-        page=page,
-        per_page=per_page,
-        date_from=date_from,
-        date_to=date_to,
-        movement_type=final_movement_type,
-        category=category,
-        description_contains=description_contains,
-        amount_min=amount_min,
-        amount_max=amount_max,
-        is_paid=is_paid,
-        sort_by=sort_by,
-        sort_order=sort_order,
-    )
+    try:
+        transaction_filters = TransactionFilters(
+            page=page,
+            per_page=per_page,
+            date_from=date_from,
+            date_to=date_to,
+            movement_type=final_movement_type,
+            category=category,
+            description_contains=description_contains,
+            amount_min=amount_min,
+            amount_max=amount_max,
+            is_paid=is_paid,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            with_total=with_total,
+            cursor=cursor,
+        )
+    except ValueError:
+        # Malformed cursor
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
     # Get transactions using the new structured filtering method
     transaction_service = TransactionService(db)
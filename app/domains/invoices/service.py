@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.core.logging_config import get_logger
@@ -23,6 +24,10 @@ from app.domains.invoices.schemas import (
     InvoiceListResponse,
     PaginationMeta,
 )
+from app.domains.statements.pdf_extraction import (
+    extract_pdf_text,
+    get_pdf_thread_pool,
+)
 from app.domains.transactions.schemas import TransactionIn
 from app.domains.transactions.service import TransactionService
 from app.core.ai import AIClient
@@ -30,6 +35,9 @@ from app.core.ai import AIClient
 # Configure logger for this service
 logger = get_logger(__name__)
 
+# Validates a whole page of rows in one pydantic-core call
+_INVOICE_LIST_ADAPTER = TypeAdapter(List[InvoiceSchema])
+
 
 class InvoiceCreditCardNotFoundError(Exception):
     pass
@@ -165,9 +173,9 @@ class InvoiceService:
             has_previous = filters.page > 1
 
             # Convert to response schemas
-            invoice_responses = [
-                InvoiceSchema.model_validate(invoice) for invoice in invoices
-            ]
+            invoice_responses = _INVOICE_LIST_ADAPTER.validate_python(
+                invoices, from_attributes=True
+            )
 
             # Create metadata
             meta = PaginationMeta(
@@ -232,7 +240,9 @@ class InvoiceService:
             has_previous = filters.page > 1
 
             # Convert to response schemas
-            invoice_responses = [invoice for invoice in invoices]
+            invoice_responses = _INVOICE_LIST_ADAPTER.validate_python(
+                invoices, from_attributes=True
+            )
 
             # Create metadata
             meta = PaginationMeta(
@@ -289,7 +299,9 @@ class InvoiceService:
             has_previous = filters.page > 1
 
             # Convert to response schemas
-            invoice_responses = [invoice for invoice in invoices]
+            invoice_responses = _INVOICE_LIST_ADAPTER.validate_python(
+                invoices, from_attributes=True
+            )
 
             # Create metadata
             meta = PaginationMeta(
@@ -343,7 +355,7 @@ class InvoiceService:
         🎯 Parse PDF invoice and create database record - NO TIMEOUT LIMITS!
         
         This replaces the Netlify function that was timing out. The process:
-        1. Extract text from PDF using PyPDF2 or similar
+        1. Extract text from PDF (pypdfium2, with pdfplumber/PyPDF2 fallbacks)
         2. Send extracted text to OpenAI for structured parsing
         3. Create invoice record with parsed data and transactions
         
@@ -427,54 +439,19 @@ class InvoiceService:
             raise InvoiceTransactionProcessingError(f"PDF parsing failed: {str(e)}")
 
     async def _extract_pdf_text(self, pdf_content: bytes) -> str:
-        """Extract text from PDF using pdfplumber - much better than PyPDF2"""
-        def extract_text():
-            try:
-                import pdfplumber
-                import io
-                
-                logger.info(f"Starting PDF extraction with pdfplumber, content size: {len(pdf_content)} bytes")
-                
-                pdf_stream = io.BytesIO(pdf_content)
-                text_parts = []
-                
-                with pdfplumber.open(pdf_stream) as pdf:
-                    logger.info(f"PDF opened successfully, has {len(pdf.pages)} pages")
-                    
-                    for i, page in enumerate(pdf.pages):
-                        logger.info(f"Processing page {i+1}")
-                        try:
-                            logger.info(f"About to call extract_text() on page {i+1}")
-                            page_text = page.extract_text()
-                            logger.info(f"extract_text() completed for page {i+1}")
-                            if page_text:
-                                text_parts.append(page_text)
-                                logger.info(f"Page {i+1} text length: {len(page_text)}")
-                                logger.info(f"Page {i+1} first 100 chars: {page_text[:100]}")
-                            else:
-                                logger.warning(f"Page {i+1} has no extractable text")
-                        except Exception as page_error:
-                            logger.error(f"Error extracting text from page {i+1}: {str(page_error)}")
-                            logger.error(f"Page error type: {type(page_error)}")
-                            import traceback
-                            logger.error(f"Page error traceback: {traceback.format_exc()}")
-                            continue
-                
-                if not text_parts:
-                    raise InvoiceRawInvoiceEmptyError("No text could be extracted from PDF")
-                
-                logger.info(f"Successfully extracted {len(text_parts)} pages of text")
-                return "\n".join(text_parts)
-                
-            except Exception as e:
-                logger.error(f"PDF extraction failed: {str(e)}")
-                import traceback
-                logger.error(f"Traceback: {traceback.format_exc()}")
-                raise InvoiceRawInvoiceEmptyError(f"Failed to extract text from PDF: {str(e)}")
-        
-        # Run in thread to avoid blocking the async event loop
+        """
+        Extract text from PDF with pypdfium2 (PDFium, C++), falling back to
+        pdfplumber and PyPDF2 - same extraction chain as bank statements
+        """
+        # Run on the bounded PDF pool to avoid blocking the async event loop
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, extract_text)
+        pdf_text = await loop.run_in_executor(
+            get_pdf_thread_pool(), extract_pdf_text, pdf_content
+        )
+
+        if not pdf_text:
+            raise InvoiceRawInvoiceEmptyError("No text could be extracted from PDF")
+        return pdf_text
 
     async def _parse_with_ai_client(self, pdf_text: str, filename: str) -> Dict:
         """Parse extracted PDF text using AI client (supports OpenAI, Ollama, etc.)"""
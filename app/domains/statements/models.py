@@ -1,11 +1,12 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Index, String, Text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from app.db.connection_and_session import Base
+from app.db.types import PreSerializedJSON
 
 
 class Statement(Base):
@@ -16,6 +17,9 @@ class Statement(Base):
     Credit card invoices are stored in the 'invoices' table.
     """
     __tablename__ = "statements"
+    __table_args__ = (
+        Index("ix_statements_user_id_source_file_hash", "user_id", "source_file_hash"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     account_id = Column(UUID(as_uuid=True), ForeignKey("accounts.id"), nullable=False)
@@ -29,8 +33,12 @@ class Statement(Base):
     opening_balance = Column(String, nullable=True)  # Starting balance
     closing_balance = Column(String, nullable=True)  # Ending balance
     
-    # Raw statement data (JSON) - stores RawBankStatement schema
-    raw_statement = Column(JSON, nullable=False)
+    # Raw statement data (JSON) - stores RawBankStatement schema, written as
+    # the serialized JSON produced by RawBankStatement.model_dump_json()
+    raw_statement = Column(PreSerializedJSON, nullable=False)
+
+    # SHA-256 of the uploaded PDF, so re-uploads reuse the parsed data
+    source_file_hash = Column(String(64), nullable=True)
     
     # Status tracking
     is_processed = Column(Boolean, default=False)
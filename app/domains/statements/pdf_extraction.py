@@ -0,0 +1,271 @@
+"""
+PDF text extraction helpers that run outside the request thread.
+
+Kept free of app settings/DB imports so worker processes (spawned, not
+forked, to stay safe next to the server's threads) import it cheaply.
+"""
+
+import io
+import multiprocessing
+import os
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, List, Optional
+
+import pdfplumber
+import pypdfium2 as pdfium
+import PyPDF2
+
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Below this many pages, the cost of shipping the PDF to worker processes
+# outweighs the parallel speedup
+PARALLEL_PAGE_THRESHOLD = 4
+
+PDF_WORKERS = os.cpu_count() or 1
+
+# Lazy initialization: the pool is only created on the first large PDF
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+# PDFium is not thread-safe: no two threads of a process may call into it at
+# once, even on different documents. Every in-process use (open, text
+# extraction, close) holds this lock; page-parallel work runs in processes
+_pdfium_lock = threading.Lock()
+
+# Whole-document extractions in flight at once. Bounded and separate from the
+# event loop's default executor, so a burst of uploads queues here instead of
+# starving the other blocking calls (DB access) that run there
+_thread_pool: Optional[ThreadPoolExecutor] = None
+
+
+def get_pdf_process_pool() -> ProcessPoolExecutor:
+    """Get or create the process pool used for page-parallel extraction."""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=PDF_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool
+
+
+def get_pdf_thread_pool() -> ThreadPoolExecutor:
+    """Get or create the thread pool that runs extract_pdf_text."""
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = ThreadPoolExecutor(
+            max_workers=PDF_WORKERS, thread_name_prefix="pdf-extraction"
+        )
+    return _thread_pool
+
+
+def _pdfium_page_texts(pdf: pdfium.PdfDocument, start: int, stop: int) -> List[str]:
+    """
+    Text of pages [start, stop) of an open PDFium document ("" on failure).
+
+    Call with _pdfium_lock held. Pages are closed here rather than left to
+    the garbage collector, which could free them on another thread later.
+    """
+    page_texts = []
+    for i in range(start, stop):
+        page = textpage = None
+        try:
+            page = pdf[i]
+            textpage = page.get_textpage()
+            # PDFium uses CRLF line breaks
+            page_texts.append(textpage.get_text_range().replace("\r\n", "\n"))
+        except Exception as e:
+            logger.error(f"pypdfium2 error on page {i+1}: {str(e)}")
+            page_texts.append("")
+        finally:
+            if textpage is not None:
+                textpage.close()
+            if page is not None:
+                page.close()
+    return page_texts
+
+
+def _pdfplumber_page_texts(pages, start: int) -> List[str]:
+    """Text of pdfplumber pages numbered from start ("" on failure)"""
+    page_texts = []
+    for i, page in enumerate(pages, start):
+        try:
+            page_texts.append(page.extract_text() or "")
+        except Exception as e:
+            logger.error(f"pdfplumber error on page {i+1}: {str(e)}")
+            page_texts.append("")
+    return page_texts
+
+
+def extract_pdfium_pages(pdf_content: bytes, start: int, stop: int) -> List[str]:
+    """
+    Extract text of pages [start, stop) with pypdfium2.
+
+    Module-level so it can be pickled to worker processes. A page that fails
+    to decode yields an empty string, keeping positions aligned.
+    """
+    with _pdfium_lock:
+        pdf = pdfium.PdfDocument(pdf_content)
+        try:
+            return _pdfium_page_texts(pdf, start, stop)
+        finally:
+            pdf.close()
+
+
+def extract_pdfplumber_pages(pdf_content: bytes, start: int, stop: int) -> List[str]:
+    """
+    Extract text of pages [start, stop) with pdfplumber.
+
+    Module-level so it can be pickled to worker processes. A page that fails
+    to decode yields an empty string, keeping positions aligned.
+    """
+    # BytesIO over bytes shares the buffer (copy-on-write), so wrapping the
+    # upload per backend costs no extra copy of the PDF
+    with pdfplumber.open(
+        io.BytesIO(pdf_content), pages=range(start + 1, stop + 1)
+    ) as pdf:
+        return _pdfplumber_page_texts(pdf.pages, start)
+
+
+def extract_pages_parallel(
+    extract_range: Callable[[bytes, int, int], List[str]],
+    pdf_content: bytes,
+    page_count: int,
+) -> List[str]:
+    """
+    Extract all pages across CPU cores, preserving page order.
+
+    PDFium is not thread-safe and pdfplumber is pure Python (GIL-bound), so
+    parallelism uses processes; pages are split into one contiguous range per
+    worker so each worker opens the PDF once.
+    """
+    workers = min(PDF_WORKERS, page_count)
+    chunk = -(-page_count // workers)  # ceiling division
+    starts = range(0, page_count, chunk)
+    stops = [min(start + chunk, page_count) for start in starts]
+
+    page_texts: List[str] = []
+    try:
+        for texts in get_pdf_process_pool().map(
+            extract_range, [pdf_content] * len(starts), starts, stops
+        ):
+            page_texts.extend(texts)
+    except BrokenProcessPool:
+        # A crashed worker poisons the pool; drop it so the next call rebuilds
+        global _process_pool
+        _process_pool = None
+        raise
+    return page_texts
+
+
+class BasePdfBackend(ABC):
+    """Abstract base class for PDF text extraction libraries"""
+
+    name: str
+
+    @abstractmethod
+    def extract_pages(self, pdf_content: bytes) -> List[str]:
+        """Return the text of every page, in order ("" for unreadable pages)"""
+        pass
+
+
+class PdfiumBackend(BasePdfBackend):
+    """PDFium C++ engine: fastest, and parallelized across pages"""
+
+    name = "pypdfium2"
+
+    def extract_pages(self, pdf_content: bytes) -> List[str]:
+        # PDFium reads the bytes in place; small PDFs are extracted from the
+        # document opened for the page count instead of parsing it again.
+        # The lock serializes this with other upload threads, and is released
+        # before large PDFs are handed to the worker processes
+        with _pdfium_lock:
+            pdf = pdfium.PdfDocument(pdf_content)
+            try:
+                page_count = len(pdf)
+                if page_count < PARALLEL_PAGE_THRESHOLD:
+                    return _pdfium_page_texts(pdf, 0, page_count)
+            finally:
+                pdf.close()
+
+        # Pages decode independently: spread large PDFs across cores
+        return extract_pages_parallel(extract_pdfium_pages, pdf_content, page_count)
+
+
+class PdfPlumberBackend(BasePdfBackend):
+    """Pure Python, better layout for complex PDFs; parallelized across pages"""
+
+    name = "pdfplumber"
+
+    def extract_pages(self, pdf_content: bytes) -> List[str]:
+        with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
+            page_count = len(pdf.pages)
+            if page_count < PARALLEL_PAGE_THRESHOLD:
+                return _pdfplumber_page_texts(pdf.pages, 0)
+
+        return extract_pages_parallel(
+            extract_pdfplumber_pages, pdf_content, page_count
+        )
+
+
+class PyPDF2Backend(BasePdfBackend):
+    """Last-resort fallback"""
+
+    name = "PyPDF2"
+
+    def extract_pages(self, pdf_content: bytes) -> List[str]:
+        page_texts = []
+        for i, page in enumerate(PyPDF2.PdfReader(io.BytesIO(pdf_content)).pages):
+            try:
+                page_texts.append(page.extract_text() or "")
+            except Exception as e:
+                logger.error(f"PyPDF2 error on page {i+1}: {str(e)}")
+                page_texts.append("")
+        return page_texts
+
+
+# Tried in order until one of them yields any text
+PDF_BACKENDS: List[BasePdfBackend] = [
+    PdfiumBackend(),
+    PdfPlumberBackend(),
+    PyPDF2Backend(),
+]
+
+
+def extract_pdf_text(pdf_content: bytes) -> str:
+    """
+    Extract the text of a PDF with the first backend that yields any.
+
+    Blocking; returns "" when no backend could extract text (image-based,
+    password-protected or corrupted files).
+    """
+    for backend in PDF_BACKENDS:
+        try:
+            logger.info(f"Trying {backend.name} extraction...")
+            page_texts = backend.extract_pages(pdf_content)
+        except Exception as e:
+            logger.warning(f"{backend.name} failed: {str(e)}")
+            continue
+
+        logger.info(f"PDF has {len(page_texts)} pages")
+        text_parts = []
+        for i, page_text in enumerate(page_texts):
+            if page_text.strip():
+                text_parts.append(page_text)
+                logger.debug(
+                    f"{backend.name} page {i+1}: extracted {len(page_text)} characters"
+                )
+            else:
+                logger.debug(f"{backend.name} page {i+1}: no text extracted")
+
+        if text_parts:
+            logger.info(
+                f"{backend.name} extracted {len(text_parts)} pages successfully"
+            )
+            return "\n".join(text_parts)
+
+    return ""
@@ -2,12 +2,51 @@ from datetime import datetime
 from typing import List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, asc, desc
-from sqlalchemy.orm import Session
+from sqlalchemy import Text, and_, asc, cast, desc, func, update
+from sqlalchemy.orm import Session, load_only
 
 from app.domains.statements.models import Statement
 from app.domains.statements.schemas import StatementFilters
 
+# Columns needed by list endpoints (StatementListItem). raw_statement is left
+# out on purpose: it is the widest column and is only served by get-by-id.
+STATEMENT_LIST_COLUMNS = (
+    Statement.id,
+    Statement.account_id,
+    Statement.user_id,
+    Statement.period_start,
+    Statement.period_end,
+    Statement.opening_balance,
+    Statement.closing_balance,
+    Statement.is_processed,
+    Statement.is_deleted,
+    Statement.created_at,
+    Statement.updated_at,
+)
+
+# Row serialized by Postgres, same keys/order as StatementListItem. Cast to
+# text so the driver hands back the JSON string instead of parsing it.
+STATEMENT_LIST_ITEM_JSON = cast(
+    func.json_build_object(
+        "id", Statement.id,
+        "account_id", Statement.account_id,
+        "user_id", Statement.user_id,
+        "period_start", Statement.period_start,
+        "period_end", Statement.period_end,
+        "opening_balance", Statement.opening_balance,
+        "closing_balance", Statement.closing_balance,
+        "is_processed", Statement.is_processed,
+        "is_deleted", Statement.is_deleted,
+        "created_at", Statement.created_at,
+        "updated_at", Statement.updated_at,
+    ),
+    Text,
+)
+
+# Total number of matching rows, evaluated before LIMIT/OFFSET, repeated on
+# every row of the page
+TOTAL_COUNT = func.count().over().label("total_count")
+
 
 class StatementRepository:
     def __init__(self, db: Session):
@@ -39,20 +78,45 @@ class StatementRepository:
             .first()
         )
 
+    def get_raw_statement_by_file_hash(
+        self, user_id: UUID, source_file_hash: str
+    ) -> Optional[dict]:
+        """
+        Get the raw statement last parsed from the same file by this user.
+
+        Deleted statements are included: the parse itself is still valid.
+        """
+        row = (
+            self.db.query(Statement.raw_statement)
+            .filter(
+                and_(
+                    Statement.user_id == user_id,
+                    Statement.source_file_hash == source_file_hash,
+                )
+            )
+            .order_by(desc(Statement.created_at))
+            .first()
+        )
+        return row[0] if row else None
+
     def get_account_statements_with_filters(
         self,
         account_id: UUID,
         user_id: UUID,
         filters: Optional[StatementFilters] = None,
-    ) -> Tuple[List[Statement], int]:
+    ) -> Tuple[List[Statement], Optional[int]]:
         """Get account statements with filtering and pagination"""
         
-        # Base query
-        query = self.db.query(Statement).filter(
-            and_(
-                Statement.account_id == account_id,
-                Statement.user_id == user_id,
-                Statement.is_deleted == False,
+        # Base query (list columns only, raw_statement is not loaded)
+        query = (
+            self.db.query(Statement)
+            .options(load_only(*STATEMENT_LIST_COLUMNS))
+            .filter(
+                and_(
+                    Statement.account_id == account_id,
+                    Statement.user_id == user_id,
+                    Statement.is_deleted == False,
+                )
             )
         )
 
@@ -60,29 +124,49 @@ class StatementRepository:
         if filters:
             query = self._apply_filters(query, filters)
             query = self._apply_sorting(query, filters)
+            return self._fetch_page(query, filters)
 
-            # Get total count before pagination
-            total_count = query.count()
-            
-            # Apply pagination
-            query = self._apply_pagination(query, filters)
-        else:
-            total_count = query.count()
+        statements = query.all()
+        return statements, len(statements)
 
-        return query.all(), total_count
+    def get_account_statements_json_with_filters(
+        self,
+        account_id: UUID,
+        user_id: UUID,
+        filters: StatementFilters,
+    ) -> Tuple[List[str], Optional[int]]:
+        """
+        Same page as get_account_statements_with_filters, but each row comes
+        back as JSON text built by Postgres (no ORM hydration).
+        """
+        query = self.db.query(STATEMENT_LIST_ITEM_JSON).filter(
+            and_(
+                Statement.account_id == account_id,
+                Statement.user_id == user_id,
+                Statement.is_deleted == False,
+            )
+        )
+        query = self._apply_filters(query, filters)
+        query = self._apply_sorting(query, filters)
+
+        return self._fetch_page(query, filters)
 
     def get_user_statements_with_filters(
         self,
         user_id: UUID,
         filters: Optional[StatementFilters] = None,
-    ) -> Tuple[List[Statement], int]:
+    ) -> Tuple[List[Statement], Optional[int]]:
         """Get all user statements with filtering and pagination"""
         
-        # Base query
-        query = self.db.query(Statement).filter(
-            and_(
-                Statement.user_id == user_id,
-                Statement.is_deleted == False,
+        # Base query (list columns only, raw_statement is not loaded)
+        query = (
+            self.db.query(Statement)
+            .options(load_only(*STATEMENT_LIST_COLUMNS))
+            .filter(
+                and_(
+                    Statement.user_id == user_id,
+                    Statement.is_deleted == False,
+                )
             )
         )
 
@@ -90,16 +174,10 @@ class StatementRepository:
         if filters:
             query = self._apply_filters(query, filters)
             query = self._apply_sorting(query, filters)
+            return self._fetch_page(query, filters)
 
-            # Get total count before pagination
-            total_count = query.count()
-            
-            # Apply pagination
-            query = self._apply_pagination(query, filters)
-        else:
-            total_count = query.count()
-
-        return query.all(), total_count
+        statements = query.all()
+        return statements, len(statements)
 
     def _apply_filters(self, query, filters: StatementFilters):
         """Apply filters to query"""
@@ -139,13 +217,33 @@ class StatementRepository:
 
         return query
 
-    def _apply_pagination(self, query, filters: StatementFilters):
-        """Apply pagination to query"""
+    def _apply_pagination(self, query, filters: StatementFilters, extra_rows: int = 0):
+        """Apply pagination to query (extra_rows reads past the page end)"""
         page = max(1, filters.page)
         per_page = min(100, max(1, filters.per_page))
 
         offset = (page - 1) * per_page
-        return query.offset(offset).limit(per_page)
+        return query.offset(offset).limit(per_page + extra_rows)
+
+    def _fetch_page(self, query, filters: StatementFilters) -> Tuple[list, Optional[int]]:
+        """
+        Fetch one page and the total match count in a single round-trip.
+
+        A page past the end has no row to carry the window count, so only
+        then is a separate COUNT issued. Without filters.with_total nothing is
+        counted (the window count makes Postgres visit every match, not just
+        the page): the count is None and one row past the page is fetched, so
+        the caller can tell whether a next page exists.
+        """
+        if not filters.with_total:
+            return self._apply_pagination(query, filters, extra_rows=1).all(), None
+
+        rows = self._apply_pagination(query.add_columns(TOTAL_COUNT), filters).all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total_count
+
+        total_count = query.count() if filters.page > 1 else 0
+        return [], total_count
 
     def update(self, statement_id: UUID, user_id: UUID, update_data: dict) -> Optional[Statement]:
         """Update statement"""
@@ -166,16 +264,22 @@ class StatementRepository:
             raise e
 
     def delete(self, statement_id: UUID, user_id: UUID) -> bool:
-        """Soft delete statement"""
+        """Soft delete statement (one UPDATE ... RETURNING, no prior SELECT)"""
         try:
-            statement = self.get_by_id(statement_id, user_id)
-            if not statement:
-                return False
-
-            statement.is_deleted = True
-            statement.updated_at = datetime.utcnow()
+            result = self.db.execute(
+                update(Statement)
+                .where(
+                    Statement.id == statement_id,
+                    Statement.user_id == user_id,
+                    Statement.is_deleted == False,
+                )
+                .values(is_deleted=True, updated_at=datetime.utcnow())
+                .returning(Statement.id)
+                .execution_options(synchronize_session=False)
+            )
+            deleted = result.first() is not None
             self.db.commit()
-            return True
+            return deleted
         except Exception as e:
             self.db.rollback()
             raise e
\ No newline at end of file
@@ -2,14 +2,28 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+)
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
+from app.core.config import get_settings
 from app.core.dependencies import get_current_user_id, get_ai_client
 from app.core.logging_config import get_logger
-from app.core.error_handlers import NotFoundError
+from app.core.error_handlers import NotFoundError, ValidationError
+from app.core.utils import build_etag, etag_matches
 from app.db.connection_and_session import get_db_session
 from app.core.ai import AIClient
+from app.domains.accounts.service import AccountService
 from app.domains.statements.schemas import (
     StatementFilters,
     StatementIn,
@@ -17,6 +31,9 @@ from app.domains.statements.schemas import (
     StatementResponse,
 )
 from app.domains.statements.service import StatementService
+from app.domains.statements.validators import read_pdf_upload
+
+logger = get_logger(__name__)
 
 router = APIRouter()
 
@@ -45,6 +62,7 @@ def create_statement_endpoint(
 
 @router.get("", response_model=StatementListResponse)
 def get_statements_endpoint(
+    request: Request,
     account_id: Optional[UUID] = Query(None, description="Filter by account ID"),
     is_processed: Optional[bool] = Query(None, description="Filter by processing status"),
     is_deleted: Optional[bool] = Query(False, description="Include deleted statements"),
@@ -54,6 +72,9 @@ def get_statements_endpoint(
     sort_order: Optional[str] = Query("desc", description="Sort order: desc or asc"),
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page (max 100)"),
+    with_total: bool = Query(
+        True, description="Count all matches (false: meta.total is null, faster)"
+    ),
     db: Session = Depends(get_db_session),
     user_id: UUID = Depends(get_current_user_id),
 ):
@@ -73,17 +94,30 @@ def get_statements_endpoint(
             sort_order=sort_order,
             page=page,
             per_page=per_page,
+            with_total=with_total,
         )
 
         service = StatementService(db)
         
         # If account_id is provided, get statements for that account
         if account_id:
-            return service.get_account_statements_with_filters(
+            # Body is serialized by Postgres; returned as-is (response_model
+            # only documents the shape)
+            body = service.get_account_statements_json(
                 account_id=account_id,
                 user_id=user_id,
                 filters=filters,
             )
+
+            etag = build_etag(body)
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers={"ETag": etag})
+
+            return Response(
+                content=body,
+                media_type="application/json",
+                headers={"ETag": etag},
+            )
         else:
             # This would need to be implemented in service for all user statements
             raise HTTPException(
@@ -91,6 +125,10 @@ def get_statements_endpoint(
                 detail="account_id is required for statement filtering"
             )
 
+    except HTTPException:
+        raise  # Re-raise HTTP exceptions as-is
+    except NotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving statements: {str(e)}")
 
@@ -98,13 +136,27 @@ def get_statements_endpoint(
 @router.get("/{statement_id}", response_model=StatementResponse)
 def get_statement_by_id_endpoint(
     statement_id: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db_session),
     user_id: UUID = Depends(get_current_user_id),
 ):
-    """Get a specific statement by ID"""
+    """
+    Get a specific statement by ID.
+
+    Supports conditional requests: the ETag is derived from `updated_at`, so a
+    client sending a matching `If-None-Match` gets a 304 without the statement
+    (and its raw_statement JSON) being serialized again.
+    """
     try:
         service = StatementService(db)
         statement = service.get_statement_by_id(statement_id, user_id)
+
+        etag = build_etag(statement.id, statement.updated_at.isoformat())
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        response.headers["ETag"] = etag
         return StatementResponse.model_validate(statement)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -142,27 +194,23 @@ async def parse_pdf_statement_endpoint(
     5. Return complete statement response
     """
     try:
-        # Validate file type
-        if not file.filename or not file.filename.lower().endswith('.pdf'):
-            raise HTTPException(status_code=400, detail="File must be a PDF")
-        
-        if not file.content_type or file.content_type != 'application/pdf':
-            raise HTTPException(status_code=400, detail="Invalid file type")
-        
-        # Validate account ownership
-        from app.domains.accounts.service import AccountService
+        # Validate account ownership (memoized on the session, so the same
+        # check inside create_statement does not query the account again)
         account_service = AccountService(db)
-        account = account_service.get_account_by_id(account_id, user_id)
+        account = await run_in_threadpool(
+            account_service.get_owned_account, account_id, user_id
+        )
         if not account:
             raise HTTPException(status_code=404, detail="Account not found")
         
-        # Read PDF file
-        pdf_content = await file.read()
-        
-        # Process PDF and create statement
+        # Process PDF and create statement. The upload (type and size checked
+        # before it is read) is passed without keeping a local reference, so
+        # the service can release the bytes once the text is extracted.
         service = StatementService(db, ai_client)
         statement = await service.parse_pdf_and_create_statement(
-            pdf_content=pdf_content,
+            pdf_content=await read_pdf_upload(
+                file, get_settings().MAX_PDF_UPLOAD_BYTES
+            ),
             filename=file.filename,
             account_id=account_id,
             user_id=user_id,
@@ -172,8 +220,12 @@ async def parse_pdf_statement_endpoint(
         
     except HTTPException:
         raise  # Re-raise HTTP exceptions as-is
+    except NotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except (ValidationError, ValueError) as e:
+        # Unreadable PDF, AI output that does not parse, invalid statement data
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger = get_logger(__name__)
         logger.error(
             f"PDF parsing failed: {str(e)}",
             extra={
@@ -183,10 +235,7 @@ async def parse_pdf_statement_endpoint(
                 "error": str(e)
             }
         )
-        raise HTTPException(
-            status_code=500, 
-            detail=f"PDF parsing failed: {str(e)}"
-        )
+        raise HTTPException(status_code=500, detail="PDF parsing failed")
 
 
 @router.delete("/{statement_id}", status_code=204)
@@ -217,7 +266,6 @@ def delete_statement_endpoint(
     except HTTPException:
         raise  # Re-raise HTTP exceptions as-is
     except Exception as e:
-        logger = get_logger(__name__)
         logger.error(
             f"Error deleting statement: {str(e)}",
             extra={
@@ -88,6 +88,29 @@ class StatementResponse(BaseModel):
         from_attributes = True
 
 
+# List item schema for bank statements (no raw_statement blob)
+class StatementListItem(BaseModel):
+    """Summary of a bank account statement, as returned by list endpoints"""
+    id: UUID
+    account_id: UUID
+    user_id: UUID
+
+    # Bank statement specific fields
+    period_start: Optional[datetime] = None
+    period_end: Optional[datetime] = None
+    opening_balance: Optional[str] = None
+    closing_balance: Optional[str] = None
+
+    # Status fields
+    is_processed: bool
+    is_deleted: bool
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 # Filtering schema for statements
 class StatementFilters(BaseModel):
     account_id: Optional[UUID] = None
@@ -99,11 +122,14 @@ class StatementFilters(BaseModel):
     sort_order: Optional[str] = "desc"
     page: int = 1
     per_page: int = 20
+    # False skips counting the matches (meta.total is null); has_next then
+    # comes from fetching one extra row
+    with_total: bool = True
 
 
 # Pagination metadata
 class StatementListMeta(BaseModel):
-    total: int
+    total: Optional[int] = None
     page: int = 1
     per_page: int = 20
     has_next: bool = False
@@ -112,5 +138,5 @@ class StatementListMeta(BaseModel):
 
 # Response with pagination
 class StatementListResponse(BaseModel):
-    data: List[StatementResponse]
+    data: List[StatementListItem]
     meta: StatementListMeta
\ No newline at end of file
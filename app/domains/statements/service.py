@@ -1,29 +1,135 @@
 import asyncio
+import hashlib
 import json
 import os
+import re
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from uuid import UUID
 
+from pydantic import TypeAdapter, ValidationError as PydanticValidationError
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from app.core.error_handlers import NotFoundError, ValidationError
 from app.core.logging_config import get_logger
 from app.domains.accounts.service import AccountService
 from app.domains.statements.models import Statement
+from app.domains.statements.pdf_extraction import (
+    extract_pdf_text,
+    get_pdf_thread_pool,
+)
 from app.domains.statements.repository import StatementRepository
 from app.domains.statements.schemas import (
     StatementFilters,
+    RawBankStatement,
     StatementIn,
+    StatementListItem,
     StatementListMeta,
     StatementListResponse,
-    StatementResponse,
 )
 from app.core.ai import AIClient
 
 # Configure logger for this service
 logger = get_logger(__name__)
 
+# Validates a whole page of rows in one pydantic-core call
+_STATEMENT_LIST_ADAPTER = TypeAdapter(List[StatementListItem])
+
+# AI parses keyed by (text digest, language), newest last. Bounded LRU with a
+# TTL; holds the parse as JSON so every hit gets a fresh, unshared model
+AI_PARSE_CACHE_SIZE = 128
+AI_PARSE_CACHE_TTL_SECONDS = 24 * 60 * 60
+_ai_parse_cache: "OrderedDict[Tuple[str, str], Tuple[float, str]]" = OrderedDict()
+
+
+def _get_cached_ai_parse(key: Tuple[str, str]) -> Optional[RawBankStatement]:
+    entry = _ai_parse_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, raw_statement_json = entry
+    if time.monotonic() - stored_at > AI_PARSE_CACHE_TTL_SECONDS:
+        del _ai_parse_cache[key]
+        return None
+    _ai_parse_cache.move_to_end(key)
+    return RawBankStatement.model_validate_json(raw_statement_json)
+
+
+def _cache_ai_parse(key: Tuple[str, str], raw_statement: RawBankStatement) -> None:
+    _ai_parse_cache[key] = (time.monotonic(), raw_statement.model_dump_json())
+    _ai_parse_cache.move_to_end(key)
+    while len(_ai_parse_cache) > AI_PARSE_CACHE_SIZE:
+        _ai_parse_cache.popitem(last=False)
+
+
+# "06/02/2025 - 07/04/2025": the period format of Brazilian bank statements
+_PERIOD_RE = re.compile(r"(\d{2})/(\d{2})/(\d{4})\s*-\s*(\d{2})/(\d{2})/(\d{4})")
+
+
+def _parse_ddmmyyyy(value: str) -> datetime:
+    """Parse a fixed "DD/MM/YYYY" date by slicing (much cheaper than strptime)."""
+    if len(value) != 10 or value[2] != "/" or value[5] != "/":
+        raise ValueError(f"Date {value!r} is not in DD/MM/YYYY format")
+    return datetime(int(value[6:10]), int(value[3:5]), int(value[0:2]))
+
+
+def _parse_date(value: str) -> Optional[datetime]:
+    """
+    Parse an AI-extracted date string.
+
+    Tries ISO 8601 first (datetime.fromisoformat is implemented in C), then
+    the DD/MM/YYYY format used by Brazilian bank statements. Returns None if
+    neither matches.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    try:
+        return _parse_ddmmyyyy(value)
+    except ValueError:
+        return None
+
+
+# Periods repeat across an account's statements and across re-imports; the
+# result is a tuple of immutable datetimes, so it is safe to share
+@lru_cache(maxsize=1024)
+def _parse_period(period: str) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    Parse an AI-extracted "start - end" period into its two dates.
+
+    ISO 8601 bounds are tried first (datetime.fromisoformat is implemented in
+    C), then the usual DD/MM/YYYY form is matched by one compiled regex and
+    built from its integer groups; other formats fall back to parsing each
+    date. A date that can't be parsed comes back as None.
+    """
+    period_parts = period.split(" - ")
+    if len(period_parts) == 2:
+        try:
+            return (
+                datetime.fromisoformat(period_parts[0].strip()),
+                datetime.fromisoformat(period_parts[1].strip()),
+            )
+        except ValueError:
+            pass
+
+    match = _PERIOD_RE.fullmatch(period.strip())
+    if match:
+        try:
+            return (
+                datetime(int(match[3]), int(match[2]), int(match[1])),
+                datetime(int(match[6]), int(match[5]), int(match[4])),
+            )
+        except ValueError:
+            return None, None
+
+    if len(period_parts) != 2:
+        return None, None
+    return _parse_date(period_parts[0].strip()), _parse_date(period_parts[1].strip())
+
 
 class StatementService:
     def __init__(self, db: Session, ai_client: Optional[AIClient] = None):
@@ -32,41 +138,44 @@ class StatementService:
         self.account_service = AccountService(db)
         self.ai_client = ai_client
 
-    def create_statement(self, statement_in: StatementIn, user_id: UUID) -> Statement:
+    def create_statement(
+        self,
+        statement_in: StatementIn,
+        user_id: UUID,
+        source_file_hash: Optional[str] = None,
+    ) -> Statement:
         try:
-            # Validate account exists and belongs to user
-            account = self.account_service.get_account_by_id(
-                statement_in.account_id, user_id
-            )
-            if not account:
-                raise NotFoundError(
-                    message=f"Account {statement_in.account_id} not found or not accessible",
-                    error_code="ACCOUNT_NOT_FOUND"
-                )
-
-            # Prepare statement data
-            statement_data = {
-                "account_id": statement_in.account_id,
-                "user_id": user_id,
-                "raw_statement": statement_in.raw_statement.model_dump(),
-            }
-
-            # Extract and parse structured data from raw statement
-            self._enrich_statement_data(statement_data, statement_in.raw_statement)
+            statement_data = self._build_statement_data(statement_in, user_id)
+            statement_data["source_file_hash"] = source_file_hash
 
             # Create statement
             statement = self.repository.create(statement_data)
             return statement
 
-        except NotFoundError:
-            raise
-        except Exception as e:
+        except SQLAlchemyError as e:
             logger.error(f"Error creating statement: {str(e)}")
             raise ValidationError(
                 message="Failed to create statement",
                 error_code="STATEMENT_CREATION_FAILED"
             )
 
+    def _build_statement_data(self, statement_in: StatementIn, user_id: UUID) -> dict:
+        """Validate account ownership and build the statement row to insert."""
+        # Validate account exists and belongs to user
+        self._ensure_owned_account(statement_in.account_id, user_id)
+
+        # Prepare statement data
+        statement_data = {
+            "account_id": statement_in.account_id,
+            "user_id": user_id,
+            # Serialized once by pydantic-core; stored without re-encoding
+            "raw_statement": statement_in.raw_statement.model_dump_json(),
+        }
+
+        # Extract and parse structured data from raw statement
+        self._enrich_statement_data(statement_data, statement_in.raw_statement)
+        return statement_data
+
     def get_account_statements_with_filters(
         self,
         account_id: UUID,
@@ -74,22 +183,7 @@ class StatementService:
         filters: Optional[StatementFilters] = None,
     ) -> StatementListResponse:
         """Get paginated statements for a specific account"""
-        
-        # Validate account exists and belongs to user
-        account = self.account_service.get_account_by_id(account_id, user_id)
-        if not account:
-            raise NotFoundError(
-                message=f"Account {account_id} not found or not accessible",
-                error_code="ACCOUNT_NOT_FOUND"
-            )
-
-        # Set default filters if none provided
-        if filters is None:
-            filters = StatementFilters()
-
-        # Validate pagination parameters
-        filters.page = max(1, filters.page)
-        filters.per_page = min(100, max(1, filters.per_page))
+        filters = self._normalize_filters(filters)
 
         try:
             statements, total_count = self.repository.get_account_statements_with_filters(
@@ -98,31 +192,97 @@ class StatementService:
                 filters=filters,
             )
 
-            # Calculate pagination metadata
-            total_pages = (total_count + filters.per_page - 1) // filters.per_page
-            has_next = filters.page < total_pages
-            has_previous = filters.page > 1
+            if not statements and not total_count:
+                self._ensure_owned_account(account_id, user_id)
+
+            meta = self._build_list_meta(total_count, filters, len(statements))
 
             # Convert to response schemas
-            statement_responses = [
-                StatementResponse.model_validate(statement) for statement in statements
-            ]
-
-            # Create metadata
-            meta = StatementListMeta(
-                total=total_count,
-                page=filters.page,
-                per_page=filters.per_page,
-                has_next=has_next,
-                has_previous=has_previous,
+            statement_responses = _STATEMENT_LIST_ADAPTER.validate_python(
+                statements[:filters.per_page], from_attributes=True
             )
 
             return StatementListResponse(data=statement_responses, meta=meta)
 
-        except Exception as e:
+        except SQLAlchemyError as e:
+            logger.error(f"Error retrieving statements for account {account_id}: {str(e)}")
+            raise
+
+    def get_account_statements_json(
+        self,
+        account_id: UUID,
+        user_id: UUID,
+        filters: Optional[StatementFilters] = None,
+    ) -> str:
+        """
+        JSON fast path of get_account_statements_with_filters.
+
+        Returns the serialized StatementListResponse body. Rows are serialized
+        by Postgres, so large raw_statement blobs never go through the ORM or
+        per-row Pydantic validation.
+        """
+        filters = self._normalize_filters(filters)
+
+        try:
+            rows_json, total_count = self.repository.get_account_statements_json_with_filters(
+                account_id=account_id,
+                user_id=user_id,
+                filters=filters,
+            )
+
+            if not rows_json and not total_count:
+                self._ensure_owned_account(account_id, user_id)
+
+            meta = self._build_list_meta(total_count, filters, len(rows_json))
+            rows_json = rows_json[:filters.per_page]
+            return f'{{"data":[{",".join(rows_json)}],"meta":{meta.model_dump_json()}}}'
+
+        except SQLAlchemyError as e:
             logger.error(f"Error retrieving statements for account {account_id}: {str(e)}")
             raise
 
+    def _ensure_owned_account(self, account_id: UUID, user_id: UUID) -> None:
+        """
+        Raise NotFoundError unless the account belongs to the user.
+
+        List queries are already scoped by Statement.user_id, so any returned
+        row proves ownership; they only call this when nothing matched, to
+        tell an unknown account apart from one without statements.
+        """
+        if not self.account_service.get_owned_account(account_id, user_id):
+            raise NotFoundError(
+                message=f"Account {account_id} not found or not accessible",
+                error_code="ACCOUNT_NOT_FOUND"
+            )
+
+    def _normalize_filters(self, filters: Optional[StatementFilters]) -> StatementFilters:
+        # Set default filters if none provided
+        if filters is None:
+            filters = StatementFilters()
+
+        # Validate pagination parameters
+        filters.page = max(1, filters.page)
+        filters.per_page = min(100, max(1, filters.per_page))
+        return filters
+
+    def _build_list_meta(
+        self, total_count: Optional[int], filters: StatementFilters, rows_fetched: int
+    ) -> StatementListMeta:
+        if total_count is None:
+            # Uncounted page: the repository read one row past the page end
+            has_next = rows_fetched > filters.per_page
+        else:
+            total_pages = (total_count + filters.per_page - 1) // filters.per_page
+            has_next = filters.page < total_pages
+
+        return StatementListMeta(
+            total=total_count,
+            page=filters.page,
+            per_page=filters.per_page,
+            has_next=has_next,
+            has_previous=filters.page > 1,
+        )
+
     def get_statement_by_id(self, statement_id: UUID, user_id: UUID) -> Statement:
         """Get statement by ID"""
         statement = self.repository.get_by_id(statement_id, user_id)
@@ -133,27 +293,26 @@ class StatementService:
             )
         return statement
 
-    def _enrich_statement_data(self, statement_data: dict, raw_statement) -> None:
+    def _enrich_statement_data(
+        self, statement_data: dict, raw_statement: RawBankStatement
+    ) -> None:
         try:
             # Parse period dates if available
-            if hasattr(raw_statement, 'period') and raw_statement.period:
-                period_parts = raw_statement.period.split(' - ')
-                if len(period_parts) == 2:
-                    try:
-                        # Parse dates in format "06/02/2025 - 07/04/2025"
-                        period_start = datetime.strptime(period_parts[0].strip(), "%d/%m/%Y")
-                        period_end = datetime.strptime(period_parts[1].strip(), "%d/%m/%Y")
-                        statement_data["period_start"] = period_start
-                        statement_data["period_end"] = period_end
-                    except ValueError:
-                        logger.warning("Could not parse period dates from statement")
+            if raw_statement.period:
+                # Parse dates in format "06/02/2025 - 07/04/2025" (or ISO 8601)
+                period_start, period_end = _parse_period(raw_statement.period)
+                if period_start and period_end:
+                    statement_data["period_start"] = period_start
+                    statement_data["period_end"] = period_end
+                else:
+                    logger.warning("Could not parse period dates from statement")
 
             # Extract bank statement balances (keep as strings to preserve formatting)
-            statement_data["opening_balance"] = getattr(raw_statement, 'opening_balance', None)
-            statement_data["closing_balance"] = getattr(raw_statement, 'closing_balance', None)
+            statement_data["opening_balance"] = raw_statement.opening_balance
+            statement_data["closing_balance"] = raw_statement.closing_balance
             
-            logger.info(
-                f"Enriched bank statement data",
+            logger.debug(
+                "Enriched bank statement data",
                 extra={
                     "period_start": statement_data.get("period_start"),
                     "period_end": statement_data.get("period_end"),
@@ -220,9 +379,11 @@ class StatementService:
         🎯 Parse PDF statement and create database record - NO TIMEOUT LIMITS!
         
         This replaces the Netlify function that was timing out. The process:
-        1. Extract text from PDF using PyPDF2 or similar
+        1. Extract text from PDF (pypdfium2, with pdfplumber/PyPDF2 fallbacks)
         2. Send extracted text to OpenAI for structured parsing
         3. Create statement record with parsed data
+
+        Steps 1-2 are skipped when this user already uploaded the same file.
         
         Benefits over Netlify function:
         - ✅ No 10-second timeout limit
@@ -230,17 +391,30 @@ class StatementService:
         - ✅ Direct database access
         - ✅ Better error handling and logging
         """
-        try:
+        logger.info(
+            f"Starting PDF parsing for file: {filename}",
+            extra={
+                "filename": filename,
+                "file_size": len(pdf_content),
+                "account_id": str(account_id),
+                "user_id": str(user_id),
+            }
+        )
+
+        # Re-uploads of the same file (e.g. client retries) reuse the earlier
+        # parse instead of paying for extraction and the AI call again
+        loop = asyncio.get_event_loop()
+        file_hash, raw_statement = await loop.run_in_executor(
+            None, self._find_parsed_upload, pdf_content, user_id
+        )
+
+        if raw_statement is not None:
+            del pdf_content
             logger.info(
-                f"Starting PDF parsing for file: {filename}",
-                extra={
-                    "filename": filename,
-                    "file_size": len(pdf_content),
-                    "account_id": str(account_id),
-                    "user_id": str(user_id),
-                }
+                "Reusing parsed data of an identical upload",
+                extra={"filename": filename, "file_hash": file_hash}
             )
-
+        else:
             # Step 1: Extract text from PDF
             pdf_text = await self._extract_pdf_text(pdf_content)
             
@@ -249,165 +423,126 @@ class StatementService:
                     message="Could not extract text from PDF. File may be corrupted or image-based.",
                     error_code="PDF_TEXT_EXTRACTION_FAILED"
                 )
+
+            # The raw bytes are no longer needed; release them so they don't
+            # stay resident for the (slow) AI round-trip
+            del pdf_content
+
             # Step 2: Parse with OpenAI GPT
-            parsed_data = await self._parse_with_ai_client(pdf_text, filename)
+            raw_statement = await self._parse_with_ai_client(pdf_text, filename)
             
             logger.info(
                 f"AI parsing completed",
                 extra={
                     "filename": filename,
-                    "transactions_count": len(parsed_data.get("transactions", [])),
+                    "transactions_count": len(raw_statement.transactions),
                 }
             )
 
-            # Step 3: Create statement record
-            from app.domains.statements.schemas import StatementIn
-            
-            statement_in = StatementIn(
-                account_id=account_id,
-                raw_statement=parsed_data
-            )
-            
-            # Use existing create_statement method
-            statement = self.create_statement(statement_in, user_id)
+        # Step 3: Create statement record
+        statement_in = StatementIn(
+            account_id=account_id,
+            raw_statement=raw_statement
+        )
+        
+        # Use existing create_statement method. The session is synchronous,
+        # so run it in a thread to keep the event loop free for other uploads
+        statement = await loop.run_in_executor(
+            None, self.create_statement, statement_in, user_id, file_hash
+        )
 
-            return statement
+        return statement
 
-        except ValidationError:
-            raise
-        except Exception as e:
-            logger.error(
-                f"PDF parsing failed: {str(e)}",
-                extra={
-                    "filename": filename,
-                    "account_id": str(account_id),
-                    "user_id": str(user_id),
-                    "error": str(e),
-                }
-            )
-            raise ValidationError(
-                message=f"PDF parsing failed: {str(e)}",
-                error_code="PDF_PARSING_FAILED"
-            )
+    def _find_parsed_upload(
+        self, pdf_content: bytes, user_id: UUID
+    ) -> Tuple[str, Optional[RawBankStatement]]:
+        """Hash the upload and look up data already parsed from the same file"""
+        file_hash = hashlib.sha256(pdf_content).hexdigest()
+        raw_statement = self.repository.get_raw_statement_by_file_hash(
+            user_id, file_hash
+        )
+        if raw_statement is None:
+            return file_hash, None
+        return file_hash, RawBankStatement.model_validate(raw_statement)
 
     async def _extract_pdf_text(self, pdf_content: bytes) -> str:
-        """Extract text from PDF using multiple methods"""
-        def extract_text():
-            text_parts = []
-            
-            # Method 1: Try pdfplumber first (better for complex PDFs)
-            try:
-                import pdfplumber
-                import io
-                
-                logger.info("Trying pdfplumber extraction...")
-                pdf_stream = io.BytesIO(pdf_content)
-                
-                with pdfplumber.open(pdf_stream) as pdf:
-                    logger.info(f"PDF has {len(pdf.pages)} pages")
-                    
-                    for i, page in enumerate(pdf.pages):
-                        try:
-                            page_text = page.extract_text()
-                            if page_text and page_text.strip():
-                                text_parts.append(page_text)
-                                logger.info(f"Page {i+1}: extracted {len(page_text)} characters")
-                            else:
-                                logger.warning(f"Page {i+1}: no text extracted")
-                        except Exception as e:
-                            logger.error(f"Error on page {i+1}: {str(e)}")
-                
-                if text_parts:
-                    logger.info(f"pdfplumber extracted {len(text_parts)} pages successfully")
-                    return "\n".join(text_parts)
-                    
-            except Exception as e:
-                logger.warning(f"pdfplumber failed: {str(e)}")
-            
-            # Method 2: Try PyPDF2 fallback
-            try:
-                import PyPDF2
-                import io
-                
-                logger.info("Trying PyPDF2 extraction...")
-                pdf_stream = io.BytesIO(pdf_content)
-                pdf_reader = PyPDF2.PdfReader(pdf_stream)
-                
-                for i, page in enumerate(pdf_reader.pages):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text and page_text.strip():
-                            text_parts.append(page_text)
-                            logger.info(f"PyPDF2 page {i+1}: extracted {len(page_text)} characters")
-                    except Exception as e:
-                        logger.error(f"PyPDF2 error on page {i+1}: {str(e)}")
-                
-                if text_parts:
-                    logger.info(f"PyPDF2 extracted {len(text_parts)} pages successfully")
-                    return "\n".join(text_parts)
-                    
-            except Exception as e:
-                logger.warning(f"PyPDF2 failed: {str(e)}")
-            
-            # If both methods fail
+        """Extract text from PDF using the first backend that yields any"""
+        # Run on the bounded PDF pool to avoid blocking the async event loop
+        loop = asyncio.get_event_loop()
+        pdf_text = await loop.run_in_executor(
+            get_pdf_thread_pool(), extract_pdf_text, pdf_content
+        )
+
+        if not pdf_text:
             raise ValidationError(
                 message="Could not extract text from PDF. The file might be image-based, password-protected, or corrupted.",
                 error_code="PDF_TEXT_EXTRACTION_FAILED"
             )
-        
-        # Run in thread to avoid blocking the async event loop
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, extract_text)
+        return pdf_text
 
-    async def _parse_with_ai_client(self, pdf_text: str, filename: str) -> Dict:
+    async def _parse_with_ai_client(
+        self, pdf_text: str, filename: str
+    ) -> RawBankStatement:
         """
         Parse extracted PDF text using AI client for BANK STATEMENTS.
         
-        Returns a dict compatible with RawBankStatement schema.
+        Returns the RawBankStatement built from the AI response. Results are
+        cached by a digest of the text, so reprocessing a statement whose text
+        was already parsed (same document, different file bytes) skips the
+        AI call.
         """
         if not self.ai_client:
             raise ValidationError(
                 message="AI client not configured", 
                 error_code="AI_CLIENT_NOT_CONFIGURED"
             )
+
+        language = "pt"
+        cache_key = (
+            hashlib.blake2b(pdf_text.encode(), digest_size=16).hexdigest(),
+            language,
+        )
+        cached = _get_cached_ai_parse(cache_key)
+        if cached is not None:
+            logger.info(
+                "Reusing cached AI parse",
+                extra={"filename": filename, "text_hash": cache_key[0]}
+            )
+            return cached
+        
+        # Use AI client specialized method for BANK STATEMENTS ONLY. Provider
+        # failures come back as an unsuccessful response rather than raising
+        response = await self.ai_client.parse_bank_statement(
+            text=pdf_text,
+            language=language
+        )
+        
+        if not response.success:
+            error_msg = response.error or "Unknown AI processing error"
+            logger.error(f"AI parsing failed: {error_msg}")
+            raise ValidationError(
+                message=f"AI processing failed: {error_msg}",
+                error_code="AI_PROCESSING_FAILED"
+            )
+        
+        if not response.data:
+            raise ValidationError(
+                message="AI returned empty response",
+                error_code="AI_EMPTY_RESPONSE"
+            )
         
         try:
-            # Use AI client specialized method for BANK STATEMENTS ONLY
-            response = await self.ai_client.parse_bank_statement(
-                text=pdf_text,
-                language="pt"
+            # Build RawBankStatement (NO credit card fields!) straight from the
+            # AI model's attributes; the TransactionData items are reused as-is
+            raw_statement = RawBankStatement.model_validate(
+                response.data, from_attributes=True
             )
-            
-            if not response.success:
-                error_msg = response.error or "Unknown AI processing error"
-                logger.error(f"AI parsing failed: {error_msg}")
-                raise ValidationError(
-                    message=f"AI processing failed: {error_msg}",
-                    error_code="AI_PROCESSING_FAILED"
-                )
-            
-            if not response.data:
-                raise ValidationError(
-                    message="AI returned empty response",
-                    error_code="AI_EMPTY_RESPONSE"
-                )
-            
-            # Use FinancialData directly - no conversion needed since both use TransactionData
-            financial_data = response.data
-            
-            # Build RawBankStatement compatible dict (NO credit card fields!)
-            parsed_data = {
-                "period": financial_data.period,
-                "opening_balance": getattr(financial_data, 'opening_balance', "") or "",
-                "closing_balance": getattr(financial_data, 'closing_balance', "") or "",
-                "transactions": financial_data.transactions  # Direct usage - no conversion needed!
-            }
-            
-            return parsed_data
-            
-        except Exception as e:
+        except PydanticValidationError as e:
             logger.error(f"AI parsing failed: {str(e)}")
             raise ValidationError(
                 message=f"AI processing failed: {str(e)}",
                 error_code="AI_PROCESSING_FAILED"
-            )
\ No newline at end of file
+            )
+
+        _cache_ai_parse(cache_key, raw_statement)
+        return raw_statement
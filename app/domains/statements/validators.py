@@ -0,0 +1,44 @@
+from fastapi import HTTPException, UploadFile
+
+PDF_MAGIC_BYTES = b"%PDF-"
+
+
+def _raise_too_large(max_bytes: int) -> None:
+    raise HTTPException(
+        status_code=413,
+        detail=f"PDF exceeds the maximum upload size of {max_bytes} bytes",
+    )
+
+
+async def read_pdf_upload(file: UploadFile, max_bytes: int) -> bytes:
+    """
+    Validate a PDF upload and return its content.
+
+    Cheap checks run first (filename, content type, declared size), then the
+    first bytes are sniffed for the PDF signature. Only a valid PDF is read
+    end-to-end, and never more than ``max_bytes`` + 1 bytes of it.
+    """
+    if not file.filename or not file.filename.lower().endswith(".pdf"):
+        raise HTTPException(status_code=400, detail="File must be a PDF")
+
+    if not file.content_type or file.content_type != "application/pdf":
+        raise HTTPException(status_code=400, detail="Invalid file type")
+
+    size = file.size
+    if size is None:
+        content_length = file.headers.get("content-length", "")
+        size = int(content_length) if content_length.isdigit() else None
+    if size is not None and size > max_bytes:
+        _raise_too_large(max_bytes)
+
+    header = await file.read(len(PDF_MAGIC_BYTES))
+    if not header.startswith(PDF_MAGIC_BYTES):
+        raise HTTPException(status_code=400, detail="File is not a valid PDF")
+    await file.seek(0)
+
+    # Bounded read: the declared size can be missing or wrong
+    content = await file.read(max_bytes + 1)
+    if len(content) > max_bytes:
+        _raise_too_large(max_bytes)
+
+    return content
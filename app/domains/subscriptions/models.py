@@ -1,5 +1,4 @@
 import enum
-import uuid
 from datetime import datetime
 
 from sqlalchemy import (
@@ -12,10 +11,13 @@ from sqlalchemy import (
     Index,
     String,
     DECIMAL,
+    func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import column_property, relationship
 
+from app.core.utils.ids import uuid7
 from app.db.connection_and_session import Base
 
 
@@ -29,12 +31,24 @@ class BillingCycle(enum.Enum):
 class Subscription(Base):
     __tablename__ = "subscriptions"
     __table_args__ = (
-        Index("ix_subscriptions_user_id", "user_id"),
+        # Serves user_id lookups and the (next_due_date, id) list order; the
+        # id tiebreaker lets keyset pages seek straight to their cursor
+        Index("ix_subscriptions_user_next_due", "user_id", "next_due_date", "id"),
+        # Active-only lists and the dashboard summary skip inactive rows
+        Index(
+            "ix_subscriptions_user_active_next_due",
+            "user_id",
+            "next_due_date",
+            postgresql_where=text("is_active"),
+        ),
+        # Vendors and categories belong to one user, so their id alone is as
+        # selective as (user_id, id) and also serves their FK checks
         Index("ix_subscriptions_vendor_id", "vendor_id"),
+        Index("ix_subscriptions_category_id", "category_id"),
     )
 
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
 
     # Core Subscription Data
     name = Column(String, nullable=False)  # User's name for this sub (e.g. "Netflix Family")
@@ -43,6 +57,10 @@ class Subscription(Base):
     next_due_date = Column(Date, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
 
+    # Computed by the database on every load: if next_due_date is in the
+    # future, this cycle is paid/upcoming; today or in the past, due/overdue
+    is_paid_this_cycle = column_property(next_due_date > func.current_date())
+
     # Foreign Keys
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     vendor_id = Column(UUID(as_uuid=True), ForeignKey("vendors.id"), nullable=True)
@@ -1,11 +1,76 @@
+from datetime import date
+from functools import cache
 from typing import List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, asc, desc
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import (
+    and_,
+    asc,
+    delete,
+    desc,
+    exists,
+    func,
+    inspect,
+    lambda_stmt,
+    literal,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.orm import Session, aliased, joinedload
 
+from app.domains.categories.models import UserCategory
 from app.domains.subscriptions.models import Subscription
-from app.domains.subscriptions.schemas import SubscriptionFilters
+from app.domains.subscriptions.schemas import SubscriptionFilters, SubscriptionRelation
+from app.domains.transactions.models import Transaction
+from app.domains.vendors.models import Vendor
+
+# Match count computed alongside each page row (one round-trip for both)
+TOTAL_COUNT = func.count().over().label("total_count")
+
+# List pages select plain columns instead of Subscription entities, skipping
+# ORM object construction and identity-map bookkeeping for every row. Each
+# row exposes the same attribute names as a Subscription (vendor and category
+# included, via the aliases below), so it is built into a response the same way
+LIST_COLUMNS = (
+    Subscription.id,
+    Subscription.user_id,
+    Subscription.name,
+    Subscription.amount,
+    Subscription.billing_cycle,
+    Subscription.next_due_date,
+    Subscription.vendor_id,
+    Subscription.category_id,
+    Subscription.is_active,
+    Subscription.created_at,
+    Subscription.updated_at,
+    Subscription.is_paid_this_cycle,
+)
+
+
+# The aliases are built on first use: aliasing configures every mapper, which
+# fails while models are still being imported (e.g. Transaction's relationship
+# to Installment, registered after this module)
+@cache
+def _list_vendor():
+    return aliased(Vendor, name="vendor")
+
+
+@cache
+def _list_category():
+    return aliased(UserCategory, name="category")
+
+
+def _join_list_vendor(s):
+    vendor = _list_vendor()
+    return s.add_columns(vendor).outerjoin(vendor, Subscription.vendor_id == vendor.id)
+
+
+def _join_list_category(s):
+    category = _list_category()
+    return s.add_columns(category).outerjoin(
+        category, Subscription.category_id == category.id
+    )
 
 
 class SubscriptionRepository:
@@ -15,8 +80,7 @@ class SubscriptionRepository:
     def create(self, subscription: Subscription) -> Subscription:
         self.db.add(subscription)
         self.db.commit()
-        self.db.refresh(subscription)
-        return subscription
+        return self._reload_with_relations(subscription)
 
     def get_by_id(self, subscription_id: UUID, user_id: UUID) -> Optional[Subscription]:
         return (
@@ -28,12 +92,187 @@ class SubscriptionRepository:
 
     def update(self, subscription: Subscription) -> Subscription:
         self.db.commit()
-        self.db.refresh(subscription)
-        return subscription
+        return self._reload_with_relations(subscription)
 
-    def delete(self, subscription: Subscription) -> None:
-        self.db.delete(subscription)
-        self.db.commit()
+    def update_fields(
+        self, subscription_id: UUID, user_id: UUID, values: dict
+    ) -> Optional[Subscription]:
+        """
+        Apply column values to a user's subscription with a single UPDATE.
+
+        Ownership is checked by the WHERE clause instead of loading the row
+        first; None if the user has no such subscription.
+        """
+        try:
+            updated = self.db.execute(
+                update(Subscription)
+                .where(Subscription.id == subscription_id, Subscription.user_id == user_id)
+                .values(**values)
+                .returning(Subscription.id)
+                .execution_options(synchronize_session=False)
+            ).first()
+            if updated is None:
+                self.db.rollback()
+                return None
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return self._load_with_relations(subscription_id)
+
+    def _reload_with_relations(self, subscription: Subscription) -> Subscription:
+        """
+        Refresh a just-committed subscription together with vendor and category.
+
+        Replaces refresh() (columns only) so the response can be built without
+        lazy loads or a second fetch. The id comes from the identity key, since
+        reading the expired attribute would itself trigger a refresh.
+        """
+        return self._load_with_relations(inspect(subscription).identity[0])
+
+    def _load_with_relations(self, subscription_id: UUID) -> Subscription:
+        return (
+            self.db.query(Subscription)
+            .options(joinedload(Subscription.vendor), joinedload(Subscription.category))
+            .filter(Subscription.id == subscription_id)
+            .populate_existing()
+            .one()
+        )
+
+    def delete(self, subscription_id: UUID, user_id: UUID) -> bool:
+        """
+        Delete a user's subscription; False if there was none to delete.
+
+        Linked transactions are unlinked with one UPDATE (what the ORM cascade
+        did row by row after loading them), then the row is removed with
+        DELETE ... RETURNING instead of a SELECT followed by a DELETE.
+        """
+        owned = select(Subscription.id).where(
+            Subscription.id == subscription_id, Subscription.user_id == user_id
+        )
+        try:
+            self.db.execute(
+                update(Transaction)
+                .where(Transaction.subscription_id.in_(owned))
+                .values(subscription_id=None)
+                .execution_options(synchronize_session=False)
+            )
+            result = self.db.execute(
+                delete(Subscription)
+                .where(Subscription.id == subscription_id, Subscription.user_id == user_id)
+                .returning(Subscription.id)
+                .execution_options(synchronize_session=False)
+            )
+            deleted = result.first() is not None
+            self.db.commit()
+            return deleted
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def link_payment(
+        self, subscription: Subscription, transaction_id: UUID, next_due_date: Optional[date]
+    ) -> Tuple[Optional[Subscription], bool]:
+        """
+        Mark a transaction as this subscription's payment and move its due date.
+
+        Both UPDATEs run in one transaction with ownership in their WHERE
+        clauses. The due date only moves if it still holds the value it was
+        computed from, so two concurrent links cannot both advance from it.
+
+        Returns (reloaded subscription, True) on success, or (None, linked)
+        after a rollback, where linked tells whether the transaction was found.
+        """
+        try:
+            linked = self.db.execute(
+                update(Transaction)
+                .where(
+                    Transaction.id == transaction_id,
+                    Transaction.user_id == subscription.user_id,
+                )
+                .values(
+                    subscription_id=subscription.id,
+                    vendor_id=subscription.vendor_id,
+                    is_paid=True,
+                )
+                .returning(Transaction.id)
+                .execution_options(synchronize_session=False)
+            ).first()
+            if linked is None:
+                self.db.rollback()
+                return None, False
+
+            if next_due_date != subscription.next_due_date:
+                advanced = self.db.execute(
+                    update(Subscription)
+                    .where(
+                        Subscription.id == subscription.id,
+                        Subscription.user_id == subscription.user_id,
+                        Subscription.next_due_date == subscription.next_due_date,
+                    )
+                    .values(next_due_date=next_due_date)
+                    .returning(Subscription.id)
+                    .execution_options(synchronize_session=False)
+                ).first()
+                if advanced is None:
+                    self.db.rollback()
+                    return None, True
+
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return self._reload_with_relations(subscription), True
+
+    def find_owned_vendor_and_category(
+        self,
+        user_id: UUID,
+        vendor_id: Optional[UUID],
+        category_id: Optional[UUID],
+    ) -> Tuple[bool, bool]:
+        """
+        Whether the user owns the given vendor and category, in one SELECT.
+
+        An id that is None is reported as found.
+        """
+        vendor_found = (
+            exists().where(Vendor.id == vendor_id, Vendor.user_id == user_id)
+            if vendor_id
+            else literal(True)
+        )
+        category_found = (
+            exists().where(
+                UserCategory.id == category_id, UserCategory.user_id == user_id
+            )
+            if category_id
+            else literal(True)
+        )
+        return tuple(self.db.execute(select(vendor_found, category_found)).one())
+
+    def get_version(self, user_id: UUID) -> Tuple:
+        """
+        Values that change whenever any of a user's subscription responses do.
+
+        One aggregate over the user_id index: row and relation counts (for
+        deletes and unlinks) plus the latest updated_at of the subscriptions
+        and of the vendors and categories embedded in them.
+        """
+        return tuple(
+            self.db.execute(
+                select(
+                    func.count(Subscription.id),
+                    func.count(Subscription.vendor_id),
+                    func.count(Subscription.category_id),
+                    func.max(Subscription.updated_at),
+                    func.max(Vendor.updated_at),
+                    func.max(UserCategory.updated_at),
+                )
+                .select_from(Subscription)
+                .outerjoin(Vendor, Subscription.vendor_id == Vendor.id)
+                .outerjoin(UserCategory, Subscription.category_id == UserCategory.id)
+                .where(Subscription.user_id == user_id)
+            ).one()
+        )
 
     def get_all_active_by_user(self, user_id: UUID) -> List[Subscription]:
         """Fetches all active subscriptions for a user, with relationships."""
@@ -44,45 +283,149 @@ class SubscriptionRepository:
             .all()
         )
 
-    def get_all_with_filters(
-        self, user_id: UUID, filters: Optional[SubscriptionFilters] = None
-    ) -> Tuple[List[Subscription], int]:
-        # Base query with joined loads for performance
-        query = (
+    def get_due_between(
+        self, user_id: UUID, start_date: date, end_date: date
+    ) -> List[Subscription]:
+        """
+        Active subscriptions of a user due within [start_date, end_date],
+        with their vendor, soonest first (a range scan of the partial
+        active index).
+        """
+        return (
+            self.db.query(Subscription)
+            .options(joinedload(Subscription.vendor))
+            .filter(
+                Subscription.user_id == user_id,
+                Subscription.is_active == True,
+                Subscription.next_due_date.between(start_date, end_date),
+            )
+            .order_by(asc(Subscription.next_due_date), asc(Subscription.id))
+            .all()
+        )
+
+    def get_all_by_user(self, user_id: UUID, limit: int) -> List[Subscription]:
+        """
+        Fetches up to `limit` subscriptions of a user (active or not), with
+        relationships, in list order (next_due_date, id).
+        """
+        return (
             self.db.query(Subscription)
             .options(joinedload(Subscription.vendor), joinedload(Subscription.category))
             .filter(Subscription.user_id == user_id)
+            .order_by(asc(Subscription.next_due_date), asc(Subscription.id))
+            .limit(limit)
+            .all()
         )
 
-        # Apply structured filters
-        if filters:
-            query = self._apply_filters(query, filters)
-            query = self._apply_sorting(query, filters)
-
-            total_count = query.count()
-            query = self._apply_pagination(query, filters)
-        else:
-            total_count = query.count()
-
-        return query.all(), total_count
-
-    def _apply_filters(self, query, filters: SubscriptionFilters):
-        if filters.is_active is not None:
-            query = query.filter(Subscription.is_active == filters.is_active)
-        if filters.vendor_id:
-            query = query.filter(Subscription.vendor_id == filters.vendor_id)
-        if filters.category_id:
-            query = query.filter(Subscription.category_id == filters.category_id)
-        return query
-
-    def _apply_sorting(self, query, filters: SubscriptionFilters):
-        # Default sort by next_due_date (upcoming first)
-        query = query.order_by(asc(Subscription.next_due_date))
-        return query
-
-    def _apply_pagination(self, query, filters: SubscriptionFilters):
+    def get_all_with_filters(
+        self, user_id: UUID, filters: Optional[SubscriptionFilters] = None
+    ) -> Tuple[List, Optional[int]]:
+        """
+        One page of a user's subscriptions and the match count.
+
+        With filters, rows are LIST_COLUMNS rows (plus the included
+        relations), read like Subscription objects but not ORM-managed.
+        """
+        if not filters:
+            subscriptions = (
+                self.db.query(Subscription)
+                .options(joinedload(Subscription.vendor), joinedload(Subscription.category))
+                .filter(Subscription.user_id == user_id)
+                .all()
+            )
+            return subscriptions, len(subscriptions)
+
+        # Built as lambda statements: SQLAlchemy caches them by the lambdas'
+        # code location, so a request only binds new parameter values instead
+        # of rebuilding the expression tree and its cache key
+        stmt = lambda_stmt(
+            lambda: select(*LIST_COLUMNS).where(Subscription.user_id == user_id)
+        )
+        stmt = self._apply_relations(stmt, filters)
+        stmt = self._apply_filters(stmt, filters)
+        stmt = self._apply_sorting(stmt, filters)
+        return self._fetch_page(stmt, user_id, filters)
+
+    def _fetch_page(
+        self, stmt, user_id: UUID, filters: SubscriptionFilters
+    ) -> Tuple[List, Optional[int]]:
+        """
+        Fetch one page and the match count in a single round-trip.
+
+        The window count sees the keyset predicate, so for a cursor page it is
+        the number of matches from the cursor on. An OFFSET page past the end
+        has no row to carry the count, so only then is a separate COUNT issued.
+        Without filters.with_total nothing is counted: the count is None and
+        one row past the page is fetched, so the caller can tell whether a
+        next page exists.
+        """
+        if not filters.with_total:
+            stmt = self._apply_pagination(stmt, filters, extra_rows=1)
+            return self.db.execute(stmt).all(), None
+
+        stmt += lambda s: s.add_columns(TOTAL_COUNT)
+        rows = self.db.execute(self._apply_pagination(stmt, filters)).all()
+        if rows:
+            return rows, rows[0].total_count
+
+        is_keyset = filters.after_next_due_date and filters.after_id
+        if filters.page == 1 or is_keyset:
+            return [], 0
+
+        count_stmt = lambda_stmt(
+            lambda: select(func.count(Subscription.id)).where(
+                Subscription.user_id == user_id
+            )
+        )
+        count_stmt = self._apply_filters(count_stmt, filters)
+        return [], self.db.execute(count_stmt).scalar_one()
+
+    # Each criterion is its own lambda over plain local values (lambda
+    # statements can only track closure variables that become bound parameters)
+
+    def _apply_relations(self, stmt, filters: SubscriptionFilters):
+        # Relations left out are not joined (nor present on the rows)
+        if SubscriptionRelation.vendor in filters.include:
+            stmt += lambda s: _join_list_vendor(s)
+
+        if SubscriptionRelation.category in filters.include:
+            stmt += lambda s: _join_list_category(s)
+        return stmt
+
+    def _apply_filters(self, stmt, filters: SubscriptionFilters):
+        is_active, vendor_id, category_id = (
+            filters.is_active, filters.vendor_id, filters.category_id
+        )
+        if is_active is not None:
+            stmt += lambda s: s.where(Subscription.is_active == is_active)
+        if vendor_id:
+            stmt += lambda s: s.where(Subscription.vendor_id == vendor_id)
+        if category_id:
+            stmt += lambda s: s.where(Subscription.category_id == category_id)
+        return stmt
+
+    def _apply_sorting(self, stmt, filters: SubscriptionFilters):
+        # Default sort by next_due_date (upcoming first); id breaks ties so
+        # the order is total, as keyset pagination requires
+        stmt += lambda s: s.order_by(asc(Subscription.next_due_date), asc(Subscription.id))
+        return stmt
+
+    def _apply_pagination(self, stmt, filters: SubscriptionFilters, extra_rows: int = 0):
         page = max(1, filters.page)
         per_page = min(100, max(1, filters.per_page))
+        limit = per_page + extra_rows  # extra_rows reads past the page end
+
+        after_next_due_date, after_id = filters.after_next_due_date, filters.after_id
+        if after_next_due_date and after_id:
+            # Keyset: seek past the last row seen on the (user_id, next_due_date)
+            # index instead of scanning and discarding OFFSET rows
+            stmt += lambda s: s.where(
+                tuple_(Subscription.next_due_date, Subscription.id)
+                > tuple_(after_next_due_date, after_id)
+            )
+            stmt += lambda s: s.limit(limit)
+            return stmt
 
         offset = (page - 1) * per_page
-        return query.offset(offset).limit(per_page)
+        stmt += lambda s: s.offset(offset).limit(limit)
+        return stmt
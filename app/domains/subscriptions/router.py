@@ -2,17 +2,19 @@ from datetime import date, timedelta
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_current_user_id
 from app.db.connection_and_session import get_db_session
 from app.core.error_handlers import NotFoundError
+from app.core.utils import build_etag, etag_matches
 from app.domains.subscriptions.schemas import (
     LinkPaymentRequest,
     SubscriptionCreate,
     SubscriptionFilters,
     SubscriptionListResponse,
+    SubscriptionRelation,
     SubscriptionResponse,
     SubscriptionUpdate,
     UpcomingPaymentsListResponse,
@@ -22,6 +24,20 @@ from app.domains.subscriptions.service import SubscriptionService
 router = APIRouter()
 
 
+def _version_etag(
+    service: SubscriptionService, if_none_match: Optional[str], user_id: UUID, *parts
+) -> Optional[str]:
+    """
+    Version ETag, only when the client sent If-None-Match.
+
+    It costs an aggregate query, so requests that cannot revalidate skip it
+    and get an ETag hashed from the body they were served instead.
+    """
+    if not if_none_match:
+        return None
+    return service.get_subscriptions_etag(user_id, *parts)
+
+
 @router.post("", response_model=SubscriptionResponse, status_code=201)
 def create_subscription(
     subscription_in: SubscriptionCreate,
@@ -32,44 +48,127 @@ def create_subscription(
     service = SubscriptionService(db)
     try:
         subscription = service.create_subscription(subscription_in, current_user_id)
-        return service.get_subscription_response(subscription.id, current_user_id)
+        return service.build_subscription_response(subscription)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("", response_model=SubscriptionListResponse)
+# No response_model: the body is built with model_construct and serialized
+# here, so FastAPI does not validate it; `responses` keeps the documented schema
+@router.get("", responses={200: {"model": SubscriptionListResponse}})
 def get_subscriptions(
+    request: Request,
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     vendor_id: Optional[UUID] = Query(None, description="Filter by vendor"),
     category_id: Optional[UUID] = Query(None, description="Filter by category"),
     include_summary: bool = Query(False, description="Include financial dashboard summary in meta"),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(
+        None, description="meta.next_cursor of the previous page (overrides page)"
+    ),
+    with_total: bool = Query(
+        True, description="Count all matches (false: meta.total is null, faster)"
+    ),
+    include: Optional[str] = Query(
+        None,
+        description="Comma-separated nested objects to embed: vendor, category "
+        "(default: both; empty: none)",
+    ),
     db: Session = Depends(get_db_session),
     current_user_id: UUID = Depends(get_current_user_id),
 ):
-    """Get all subscriptions for the current user."""
+    """
+    Get all subscriptions for the current user.
+
+    Supports conditional requests: with `If-None-Match`, the ETag only
+    changes when one of the user's subscriptions (or their vendor/category)
+    does, so a match gets a 304 without the page being queried. Without it,
+    no version query runs and the ETag is a hash of the page served.
+    """
     service = SubscriptionService(db)
-    filters = SubscriptionFilters(
-        is_active=is_active,
-        vendor_id=vendor_id,
-        category_id=category_id,
-        page=page,
-        per_page=per_page,
+    relations = {}
+    if include is not None:
+        try:
+            relations["include"] = {
+                SubscriptionRelation(name.strip())
+                for name in include.split(",")
+                if name.strip()
+            }
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid include: {include}")
+
+    try:
+        filters = SubscriptionFilters(
+            is_active=is_active,
+            vendor_id=vendor_id,
+            category_id=category_id,
+            page=page,
+            per_page=per_page,
+            cursor=cursor,
+            with_total=with_total,
+            **relations,
+        )
+    except ValueError:
+        # Malformed cursor
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if_none_match = request.headers.get("if-none-match")
+    # Every query value that shapes the body versions it too; include is
+    # sorted because set order varies between processes
+    version_etag = _version_etag(
+        service,
+        if_none_match,
+        current_user_id,
+        filters.model_dump_json(exclude={"include"}),
+        ",".join(sorted(filters.include)),
+        include_summary,
     )
-    return service.get_subscriptions(current_user_id, filters, include_summary)
+    if version_etag and etag_matches(if_none_match, version_etag):
+        return Response(status_code=304, headers={"ETag": version_etag})
+
+    # Rows are built with model_construct straight from typed columns;
+    # serialize them once here instead of validating the page again
+    result = service.get_subscriptions(current_user_id, filters, include_summary)
+    body = result.model_dump_json()
+
+    # A body ETag from an earlier response still revalidates
+    body_etag = build_etag(body)
+    etag = version_etag or body_etag
+    if etag_matches(if_none_match, body_etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.get("/{subscription_id}", response_model=SubscriptionResponse)
 def get_subscription(
     subscription_id: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db_session),
     current_user_id: UUID = Depends(get_current_user_id),
 ):
-    """Get a specific subscription by ID."""
+    """Get a specific subscription by ID (conditional, like the list)."""
     service = SubscriptionService(db)
     try:
-        return service.get_subscription_response(subscription_id, current_user_id)
+        if_none_match = request.headers.get("if-none-match")
+        version_etag = _version_etag(
+            service, if_none_match, current_user_id, subscription_id
+        )
+        if version_etag and etag_matches(if_none_match, version_etag):
+            return Response(status_code=304, headers={"ETag": version_etag})
+
+        subscription = service.get_subscription_response(
+            subscription_id, current_user_id
+        )
+        body_etag = build_etag(subscription.model_dump_json())
+        etag = version_etag or body_etag
+        if etag_matches(if_none_match, body_etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        response.headers["ETag"] = etag
+        return subscription
     except Exception as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -84,8 +183,10 @@ def update_subscription(
     """Update a subscription."""
     service = SubscriptionService(db)
     try:
-        service.update_subscription(subscription_id, subscription_update, current_user_id)
-        return service.get_subscription_response(subscription_id, current_user_id)
+        subscription = service.update_subscription(
+            subscription_id, subscription_update, current_user_id
+        )
+        return service.build_subscription_response(subscription)
     except NotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -116,18 +217,21 @@ def link_payment(
 ):
     service = SubscriptionService(db)
     try:
-        service.link_payment(
+        subscription = service.link_payment(
             subscription_id=subscription_id,
             transaction_id=link_request.transaction_id,
             user_id=current_user_id
         )
 
-        return service.get_subscription_response(subscription_id, current_user_id)
+        return service.build_subscription_response(subscription)
 
+    except NotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/upcoming-bills", response_model=UpcomingPaymentsListResponse)
+# No response_model, for the same reason as the list
+@router.get("/upcoming-bills", responses={200: {"model": UpcomingPaymentsListResponse}})
 def get_upcoming_bills(
     start_date: Optional[date] = Query(None, description="Start date for projection (defaults to today)"),
     end_date: Optional[date] = Query(None, description="End date for projection (defaults to 30 days from today)"),
@@ -147,7 +251,9 @@ def get_upcoming_bills(
     if not end_date:
         end_date = start_date + timedelta(days=30)
     try:
-        return service.get_upcoming_bills(current_user_id, start_date, end_date)
+        # Built with model_construct: serialized here, like the list page
+        result = service.get_upcoming_bills(current_user_id, start_date, end_date)
+        return Response(content=result.model_dump_json(), media_type="application/json")
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
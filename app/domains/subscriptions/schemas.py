@@ -1,9 +1,10 @@
 from datetime import date, datetime
 from enum import Enum
-from typing import List, Optional
+from typing import List, Optional, Set
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
+from app.core.utils.pagination import decode_cursor
 from app.domains.vendors.schemas import VendorResponse
 from app.domains.categories.schemas import CategoryResponse
 
@@ -56,6 +57,12 @@ class SubscriptionResponse(SubscriptionBase):
         from_attributes = True
 
 
+class SubscriptionRelation(str, Enum):
+    """Nested objects a subscription list can embed in each row."""
+    vendor = "vendor"
+    category = "category"
+
+
 class SubscriptionFilters(BaseModel):
     is_active: Optional[bool] = None
     vendor_id: Optional[UUID] = None
@@ -65,6 +72,33 @@ class SubscriptionFilters(BaseModel):
     page: int = 1
     per_page: int = 20
 
+    # Keyset pagination: sort key of the last row already seen. When set,
+    # the page starts right after it and `page` is ignored. Clients pass it
+    # as `cursor` (a previous meta.next_cursor), decoded below
+    cursor: Optional[str] = None
+    after_next_due_date: Optional[date] = None
+    after_id: Optional[UUID] = None
+
+    # False skips counting the matches (meta.total is null); has_next then
+    # comes from fetching one extra row
+    with_total: bool = True
+
+    # Relations loaded and embedded in each row; the others are left out of
+    # the query (not joined) and come back as null
+    include: Set[SubscriptionRelation] = {
+        SubscriptionRelation.vendor,
+        SubscriptionRelation.category,
+    }
+
+    @model_validator(mode="after")
+    def unpack_cursor(self):
+        """Unpack `cursor` into after_next_due_date/after_id (ValueError if malformed)"""
+        if self.cursor:
+            due_date_part, id_part = decode_cursor(self.cursor, 2)
+            self.after_next_due_date = date.fromisoformat(due_date_part)
+            self.after_id = UUID(id_part)
+        return self
+
 
 class CategoryBreakdownItem(BaseModel):
     name: str
@@ -86,11 +120,15 @@ class SubscriptionSummary(BaseModel):
 
 
 class SubscriptionListMeta(BaseModel):
-    total: int
+    # Matching subscriptions; for a cursor page, those from the cursor on.
+    # None when the request opted out with with_total=false
+    total: Optional[int] = None
     page: int = 1
     per_page: int = 20
     has_next: bool = False
     has_previous: bool = False
+    # Opaque cursor for the next page (pass back as `cursor`)
+    next_cursor: Optional[str] = None
     summary: Optional[SubscriptionSummary] = None
 
 
@@ -1,31 +1,102 @@
 from datetime import date, datetime, timedelta
 from app.core.utils.date import add_months
+from app.core.utils.http_cache import build_etag
+from app.core.utils.pagination import encode_cursor
 from uuid import UUID
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Set, Tuple
 from app.core.logging_config import get_logger
 from app.core.error_handlers import NotFoundError, ValidationError
 from app.domains.subscriptions.models import Subscription, BillingCycle
 from app.domains.subscriptions.repository import SubscriptionRepository
 from app.domains.subscriptions.schemas import (
+    BillingCycle as SchemaBillingCycle,
     CategoryBreakdownItem,
     MonthlyForecastItem,
     SubscriptionCreate,
     SubscriptionFilters,
     SubscriptionListMeta,
     SubscriptionListResponse,
+    SubscriptionRelation,
     SubscriptionResponse,
     SubscriptionSummary,
     SubscriptionUpdate,
     UpcomingPaymentResponse,
     UpcomingPaymentsListResponse,
 )
+from app.domains.vendors.schemas import VendorResponse
 from app.domains.vendors.service import VendorService
+from app.domains.categories.schemas import CategoryResponse
 from app.domains.categories.service import CategoryService
-# Import TransactionUpdate for type checking if needed, but we'll use local import for Service
 from sqlalchemy.orm import Session
 
 logger = get_logger(__name__)
 
+# With include_summary, users with at most this many subscriptions get the
+# page and the summary from a single fetch of all their rows
+IN_MEMORY_LIST_THRESHOLD = 500
+
+# Months between payments of the month-based billing cycles
+_CYCLE_MONTHS = {
+    BillingCycle.monthly: 1,
+    BillingCycle.quarterly: 3,
+    BillingCycle.yearly: 12,
+}
+
+# Amount -> monthly burn rate, as (multiplier, divisor): 52 weeks / 12 months
+_MONTHLY_RATIO = {
+    BillingCycle.weekly: (52, 12),
+    BillingCycle.monthly: (1, 1),
+    BillingCycle.quarterly: (1, 3),
+    BillingCycle.yearly: (1, 12),
+}
+
+# Response fields copied as-is from the ORM row when building list pages
+# without validation (see _construct_subscription_response)
+_VENDOR_FIELDS = tuple(VendorResponse.model_fields)
+_CATEGORY_FIELDS = tuple(CategoryResponse.model_fields)
+_SUBSCRIPTION_COLUMN_FIELDS = tuple(
+    name
+    for name in SubscriptionResponse.model_fields
+    if name not in ("amount", "billing_cycle", "vendor", "category")
+)
+
+
+def _construct_vendor_response(vendor) -> Optional[VendorResponse]:
+    """VendorResponse from a loaded vendor row (or None), without validation."""
+    if vendor is None:
+        return None
+    return VendorResponse.model_construct(
+        **{name: getattr(vendor, name) for name in _VENDOR_FIELDS}
+    )
+
+
+def _construct_subscription_response(
+    subscription: Subscription, include: Set[SubscriptionRelation]
+) -> SubscriptionResponse:
+    """
+    Build a SubscriptionResponse from a loaded row without running validation.
+
+    Rows come from our own database, so their types are already right except
+    for the two columns converted here (DECIMAL -> float, ORM enum -> schema
+    enum); model_construct skips the per-field validators for the page.
+    Relations not in `include` are left as None without being touched.
+    """
+    fields = {name: getattr(subscription, name) for name in _SUBSCRIPTION_COLUMN_FIELDS}
+    vendor = category = None
+    if SubscriptionRelation.vendor in include:
+        vendor = _construct_vendor_response(subscription.vendor)
+    if SubscriptionRelation.category in include and subscription.category:
+        category = CategoryResponse.model_construct(
+            **{name: getattr(subscription.category, name) for name in _CATEGORY_FIELDS}
+        )
+    return SubscriptionResponse.model_construct(
+        **fields,
+        amount=float(subscription.amount),
+        billing_cycle=SchemaBillingCycle(subscription.billing_cycle.value),
+        vendor=vendor,
+        category=category,
+    )
+
 
 class SubscriptionService:
     def __init__(self, db: Session):
@@ -37,26 +108,9 @@ class SubscriptionService:
     def create_subscription(
         self, subscription_data: SubscriptionCreate, user_id: UUID
     ) -> Subscription:
-        # Validate Vendor
-        if subscription_data.vendor_id:
-            try:
-                self.vendor_service.get_vendor(subscription_data.vendor_id, user_id)
-            except NotFoundError:
-                raise ValidationError(
-                    message=f"Vendor with ID {subscription_data.vendor_id} not found.",
-                    error_code="VENDOR_NOT_FOUND",
-                )
-
-        # Validate Category
-        if subscription_data.category_id:
-            category = self.category_service.repository.get_category_by_id(
-                subscription_data.category_id, user_id
-            )
-            if not category:
-                raise ValidationError(
-                    message=f"Category with ID {subscription_data.category_id} not found.",
-                    error_code="CATEGORY_NOT_FOUND",
-                )
+        self._validate_vendor_and_category(
+            user_id, subscription_data.vendor_id, subscription_data.category_id
+        )
 
         subscription = Subscription(
             name=subscription_data.name,
@@ -70,6 +124,30 @@ class SubscriptionService:
         )
         return self.repository.create(subscription)
 
+    def _validate_vendor_and_category(
+        self,
+        user_id: UUID,
+        vendor_id: Optional[UUID],
+        category_id: Optional[UUID],
+    ) -> None:
+        """Check the user owns the vendor and category being assigned (one query)."""
+        if not vendor_id and not category_id:
+            return
+
+        vendor_found, category_found = self.repository.find_owned_vendor_and_category(
+            user_id, vendor_id, category_id
+        )
+        if not vendor_found:
+            raise ValidationError(
+                message=f"Vendor with ID {vendor_id} not found.",
+                error_code="VENDOR_NOT_FOUND",
+            )
+        if not category_found:
+            raise ValidationError(
+                message=f"Category with ID {category_id} not found.",
+                error_code="CATEGORY_NOT_FOUND",
+            )
+
     def get_subscription(self, subscription_id: UUID, user_id: UUID) -> Subscription:
         subscription = self.repository.get_by_id(subscription_id, user_id)
         if not subscription:
@@ -81,46 +159,67 @@ class SubscriptionService:
 
     def get_subscription_response(self, subscription_id: UUID, user_id: UUID) -> SubscriptionResponse:
         subscription = self.get_subscription(subscription_id, user_id)
-        res = SubscriptionResponse.from_orm(subscription)
-        res.is_paid_this_cycle = subscription.next_due_date > date.today()
-        return res
+        return self.build_subscription_response(subscription)
+
+    def get_subscriptions_etag(self, user_id: UUID, *parts) -> str:
+        """
+        ETag for a user's subscription responses, without loading any rows.
+
+        Includes today's date, since is_paid_this_cycle, the summary and the
+        forecast all move with it.
+        """
+        return build_etag(
+            user_id, date.today(), *self.repository.get_version(user_id), *parts
+        )
+
+    def build_subscription_response(self, subscription: Subscription) -> SubscriptionResponse:
+        """Build the response from a subscription loaded with vendor and category."""
+        # is_paid_this_cycle is a column_property computed by the query
+        return SubscriptionResponse.model_validate(subscription)
 
     def update_subscription(
         self, subscription_id: UUID, subscription_data: SubscriptionUpdate, user_id: UUID
     ) -> Subscription:
-        subscription = self.get_subscription(subscription_id, user_id)
-
-        # Validate Vendor if changing
-        if subscription_data.vendor_id and subscription_data.vendor_id != subscription.vendor_id:
-            try:
-                self.vendor_service.get_vendor(subscription_data.vendor_id, user_id)
-            except NotFoundError:
-                raise ValidationError(
-                    message=f"Vendor with ID {subscription_data.vendor_id} not found.",
-                    error_code="VENDOR_NOT_FOUND",
-                )
-
-        # Validate Category if changing
-        if subscription_data.category_id and subscription_data.category_id != subscription.category_id:
-            category = self.category_service.repository.get_category_by_id(
-                subscription_data.category_id, user_id
+        update_data = subscription_data.model_dump(exclude_unset=True)
+        if not update_data:
+            return self.get_subscription(subscription_id, user_id)
+
+        if not update_data.keys() & {"vendor_id", "category_id"}:
+            # Plain column changes need no reference checks: one UPDATE,
+            # scoped to the user, instead of loading the row first
+            subscription = self.repository.update_fields(
+                subscription_id, user_id, update_data
             )
-            if not category:
-                raise ValidationError(
-                    message=f"Category with ID {subscription_data.category_id} not found.",
-                    error_code="CATEGORY_NOT_FOUND",
+            if not subscription:
+                raise NotFoundError(
+                    message=f"Subscription with ID {subscription_id} not found",
+                    error_code="SUBSCRIPTION_NOT_FOUND",
                 )
+            return subscription
+
+        subscription = self.get_subscription(subscription_id, user_id)
+
+        # Only ids that change are validated
+        vendor_id = subscription_data.vendor_id
+        if vendor_id == subscription.vendor_id:
+            vendor_id = None
+        category_id = subscription_data.category_id
+        if category_id == subscription.category_id:
+            category_id = None
+        self._validate_vendor_and_category(user_id, vendor_id, category_id)
 
-        update_data = subscription_data.model_dump(exclude_unset=True)
         for key, value in update_data.items():
             setattr(subscription, key, value)
 
         return self.repository.update(subscription)
 
     def delete_subscription(self, subscription_id: UUID, user_id: UUID) -> None:
-        subscription = self.get_subscription(subscription_id, user_id)
         # TODO: Add check for linked transactions when Phase 4 is implemented
-        self.repository.delete(subscription)
+        if not self.repository.delete(subscription_id, user_id):
+            raise NotFoundError(
+                message=f"Subscription with ID {subscription_id} not found",
+                error_code="SUBSCRIPTION_NOT_FOUND",
+            )
 
     def get_subscriptions(
         self, 
@@ -135,25 +234,50 @@ class SubscriptionService:
         filters.page = max(1, filters.page)
         filters.per_page = min(100, max(1, filters.per_page))
 
-        subscriptions, total_count = self.repository.get_all_with_filters(user_id, filters)
-
-        # Calculate pagination metadata
-        total_pages = (total_count + filters.per_page - 1) // filters.per_page
-        has_next = filters.page < total_pages
-        has_previous = filters.page > 1
-
-        today = date.today()
-        subscription_responses = []
-        for s in subscriptions:
-            res = SubscriptionResponse.from_orm(s)
-            # Simple logic: if next_due_date is in the future, it's paid/upcoming
-            # If it's today or in the past, it's due/overdue
-            res.is_paid_this_cycle = s.next_due_date > today
-            subscription_responses.append(res)
-
         summary = None
         if include_summary:
-            summary = self._calculate_summary(user_id)
+            # One fetch serves both the summary and the page, unless the user
+            # has too many subscriptions to page through in memory
+            all_subscriptions = self.repository.get_all_by_user(
+                user_id, limit=IN_MEMORY_LIST_THRESHOLD + 1
+            )
+            if len(all_subscriptions) <= IN_MEMORY_LIST_THRESHOLD:
+                summary = self._calculate_summary(
+                    [s for s in all_subscriptions if s.is_active]
+                )
+                subscriptions, total_count = self._page_in_memory(all_subscriptions, filters)
+            else:
+                summary = self._calculate_summary(
+                    self.repository.get_all_active_by_user(user_id)
+                )
+                subscriptions, total_count = self.repository.get_all_with_filters(user_id, filters)
+        else:
+            subscriptions, total_count = self.repository.get_all_with_filters(user_id, filters)
+
+        # Calculate pagination metadata
+        if total_count is None:
+            # Uncounted page: the repository read one row past the page end
+            has_next = len(subscriptions) > filters.per_page
+            subscriptions = subscriptions[:filters.per_page]
+            has_previous = filters.page > 1 or bool(filters.after_id)
+        elif filters.after_next_due_date and filters.after_id:
+            # Keyset page: total_count counts the matches from the cursor on
+            has_next = total_count > len(subscriptions)
+            has_previous = True
+        else:
+            # Same as page < total_pages, without computing total_pages
+            # (the meta does not expose it)
+            has_next = filters.page * filters.per_page < total_count
+            has_previous = filters.page > 1
+
+        next_cursor = None
+        if has_next and subscriptions:
+            last = subscriptions[-1]
+            next_cursor = encode_cursor(last.next_due_date.isoformat(), last.id)
+
+        subscription_responses = [
+            _construct_subscription_response(s, filters.include) for s in subscriptions
+        ]
 
         meta = SubscriptionListMeta(
             total=total_count,
@@ -161,37 +285,61 @@ class SubscriptionService:
             per_page=filters.per_page,
             has_next=has_next,
             has_previous=has_previous,
+            next_cursor=next_cursor,
             summary=summary,
         )
 
         return SubscriptionListResponse(data=subscription_responses, meta=meta)
 
+    def _page_in_memory(
+        self, subscriptions: List[Subscription], filters: SubscriptionFilters
+    ) -> Tuple[List[Subscription], Optional[int]]:
+        """
+        Same page and count as repository.get_all_with_filters, taken from all
+        of the user's subscriptions already loaded in list order.
+        """
+        matches = [
+            s for s in subscriptions
+            if (filters.is_active is None or s.is_active == filters.is_active)
+            and (not filters.vendor_id or s.vendor_id == filters.vendor_id)
+            and (not filters.category_id or s.category_id == filters.category_id)
+        ]
+
+        limit = filters.per_page + (0 if filters.with_total else 1)
+        if filters.after_next_due_date and filters.after_id:
+            after = (filters.after_next_due_date, filters.after_id)
+            matches = [s for s in matches if (s.next_due_date, s.id) > after]
+            page = matches[:limit]
+        else:
+            offset = (filters.page - 1) * filters.per_page
+            page = matches[offset:offset + limit]
+
+        return page, len(matches) if filters.with_total else None
+
     def get_upcoming_bills(
         self, user_id: UUID, start_date: date, end_date: date
     ) -> UpcomingPaymentsListResponse:
         """Projects all upcoming subscription payments within a given timeframe."""
-        projected_payments = []
-        
-        # 1. Fetch all active subscriptions
-        active_subscriptions = self.repository.get_all_active_by_user(user_id)
+        # 1. Fetch the active subscriptions due in the timeframe
+        due_subscriptions = self.repository.get_due_between(
+            user_id, start_date, end_date
+        )
 
-        for sub in active_subscriptions:
-            is_subscripiton_in_date_range = sub.next_due_date >= start_date and sub.next_due_date <= end_date
-            if not is_subscripiton_in_date_range:
-                continue
-
-            projected_payments.append(
-                UpcomingPaymentResponse(
-                    id=sub.id,
-                    name=sub.name,
-                    vendor=sub.vendor,
-                    amount=float(sub.amount),
-                    due_date=sub.next_due_date,
-                    source_type="subscription"
-                )
+        # 2. Rows are already typed by the database: build the items without
+        # running validation (as for list pages)
+        projected_payments = [
+            UpcomingPaymentResponse.model_construct(
+                id=sub.id,
+                name=sub.name,
+                vendor=_construct_vendor_response(sub.vendor),
+                amount=float(sub.amount),
+                due_date=sub.next_due_date,
+                source_type="subscription",
             )
-  
-        return UpcomingPaymentsListResponse(
+            for sub in due_subscriptions
+        ]
+
+        return UpcomingPaymentsListResponse.model_construct(
             data=projected_payments,
             total=len(projected_payments)
         )
@@ -200,110 +348,115 @@ class SubscriptionService:
         """
         Link a transaction to a subscription, updating the transaction and advancing the due date.
         """
-        # Local import to avoid circular dependency
-        from app.domains.transactions.service import TransactionService
-        from app.domains.transactions.schemas import TransactionUpdate
-        
-        transaction_service = TransactionService(self.db)
-        # 1. Get Subscription
         subscription = self.get_subscription(subscription_id, user_id)
-        # 2. Verify Transaction ownership and existence
-        transaction = transaction_service.get_account_transaction_by_id(transaction_id, user_id)
-        # 3. Update Transaction (Link to sub, assign vendor, mark as paid)
-        update_data = TransactionUpdate(
-            subscription_id=subscription_id,
-            vendor_id=subscription.vendor_id, # Ensure vendor consistency
-            is_paid=True # Auto-mark as paid upon linking
+
+        next_due_date = subscription.next_due_date
+        if next_due_date:
+            next_due_date = self._calculate_next_due_date(
+                next_due_date, subscription.billing_cycle
+            )
+
+        # Linking, vendor assignment, is_paid and the new due date are written
+        # together, with ownership checked by the UPDATEs themselves
+        linked_subscription, transaction_found = self.repository.link_payment(
+            subscription, transaction_id, next_due_date
         )
-        transaction_service.update_transaction(transaction_id, user_id, update_data)
-        
-        # 4. Advance Next Due Date
-        if subscription.next_due_date:
-            new_due_date = self._calculate_next_due_date(
-                subscription.next_due_date, subscription.billing_cycle
+        if not transaction_found:
+            raise NotFoundError(
+                message="Transaction not found", error_code="TRANSACTION_NOT_FOUND"
+            )
+        if linked_subscription is None:
+            raise ValidationError(
+                message="Subscription was updated concurrently, please retry",
+                error_code="SUBSCRIPTION_CONFLICT",
             )
-            subscription.next_due_date = new_due_date
-            self.repository.update(subscription)
-            
-        return subscription
+
+        return linked_subscription
 
     def _calculate_next_due_date(self, current_date: date, cycle: BillingCycle) -> date:
         """Calculate the next due date based on the billing cycle."""
         if cycle == BillingCycle.weekly:
             return current_date + timedelta(weeks=1)
-        
-        elif cycle == BillingCycle.monthly:
-            return add_months(current_date, 1)
-            
-        elif cycle == BillingCycle.quarterly:
-            return add_months(current_date, 3)
-            
-        elif cycle == BillingCycle.yearly:
-            return add_months(current_date, 12)
-            
-        return current_date
+
+        months = _CYCLE_MONTHS.get(cycle)
+        return add_months(current_date, months) if months else current_date
 
     def _normalize_to_monthly(self, amount: float, cycle: BillingCycle) -> float:
         """Normalize subscription amount to a monthly burn rate."""
-        if cycle == BillingCycle.weekly:
-            # 52 weeks / 12 months = 4.333...
-            return float(amount) * 52 / 12
-        elif cycle == BillingCycle.monthly:
-            return float(amount)
-        elif cycle == BillingCycle.quarterly:
-            return float(amount) / 3
-        elif cycle == BillingCycle.yearly:
-            return float(amount) / 12
-        return float(amount)
+        multiplier, divisor = _MONTHLY_RATIO.get(cycle, (1, 1))
+        return float(amount) * multiplier / divisor
 
     ## [TODO] Review this logic
     def _calculate_forecast(self, active_subscriptions: List[Subscription]) -> List[MonthlyForecastItem]:
         """Project expenses for the next 12 months based on billing cycles."""
         today = date.today()
-        forecast_map: Dict[str, float] = {}
-        
-        # Initialize buckets for next 12 months (key: "Jan 26")
-        # We start from current month or next month? 
-        # Requirement says "monthly_forecast: An array of the next 12 months"
-        # Let's include current month + 11 future months
-        for i in range(12):
-            future_date = add_months(today, i)
-            key = future_date.strftime("%b %y")
-            forecast_map[key] = 0.0
+
+        # Buckets for the next 12 months, current month first. Indexed by
+        # month offset from today (instead of formatting a "Jan 26" key for
+        # every simulated payment); labels are only formatted once, below
+        first_month = today.year * 12 + today.month - 1
+        buckets = [0.0] * 12
 
         end_date = add_months(today, 12)
 
         for sub in active_subscriptions:
+            amount = float(sub.amount)
+            cycle = sub.billing_cycle
             # Simulate payments for one year
             current_date = sub.next_due_date
-            
+
             # If next due date is already passed (overdue) but not updated, 
             # we should start projecting from "future" or handle overdue as immediate?
             # For forecast, let's assume we project from the next VALID due date.
             # But here we rely on stored next_due_date.
-            
+            if cycle == BillingCycle.weekly and current_date < today:
+                # Past weekly payments are never counted: jump straight to
+                # the first one due today or later (whole weeks, same weekday)
+                weeks_behind = -(-(today - current_date).days // 7)
+                current_date += timedelta(weeks=weeks_behind)
+
             # Loop while the simulated date is within our 1-year window
             while current_date < end_date:
                 # We only sum if it falls in our window. 
                 # (next_due_date could be way in future, e.g. yearly sub)
                 if current_date >= today: # Only count future/today payments
-                    key = current_date.strftime("%b %y")
-                    # Only add if key exists in our 12-month window
-                    if key in forecast_map:
-                        forecast_map[key] += float(sub.amount)
-                
+                    month_index = current_date.year * 12 + current_date.month - 1 - first_month
+                    # The end_date month is outside our 12-month window
+                    if month_index < 12:
+                        buckets[month_index] += amount
+
                 # Advance date
-                current_date = self._calculate_next_due_date(current_date, sub.billing_cycle)
+                current_date = self._calculate_next_due_date(current_date, cycle)
 
         return [
-            MonthlyForecastItem(month=k, amount=round(v, 2)) 
-            for k, v in forecast_map.items()
+            MonthlyForecastItem(
+                month=add_months(today, i).strftime("%b %y"), amount=round(v, 2)
+            )
+            for i, v in enumerate(buckets)
         ]
 
+    def _count_occurrences(
+        self, start: date, today: date, end: date, cycle: BillingCycle
+    ) -> int:
+        """Number of payments from `start` on that fall within [today, end]."""
+        if cycle == BillingCycle.weekly:
+            # Same weekday every 7 days: count them with integer division
+            if start < today:
+                start += timedelta(weeks=-(-(today - start).days // 7))
+            return (end - start).days // 7 + 1 if start <= end else 0
+
+        # Month-based cycles clamp to month ends (Jan 31 -> Feb 28 -> Mar 28),
+        # so step through them; a window of a month holds at most two
+        count = 0
+        while start <= end:
+            if start >= today:
+                count += 1
+            start = self._calculate_next_due_date(start, cycle)
+        return count
+
     ## [TODO] Review this logic
-    def _calculate_summary(self, user_id: UUID) -> SubscriptionSummary:
-        """Calculate dashboard metrics for subscriptions."""
-        active_subs = self.repository.get_all_active_by_user(user_id)
+    def _calculate_summary(self, active_subs: List[Subscription]) -> SubscriptionSummary:
+        """Calculate dashboard metrics for the user's active subscriptions."""
         
         monthly_burn_rate = 0.0
         category_map: Dict[str, float] = {}
@@ -324,14 +477,11 @@ class SubscriptionService:
         due_next_30 = 0.0
         
         for sub in active_subs:
-             current_date = sub.next_due_date
-             # Simulate simply for the next 30 days
-             # Careful: infinite loop if cycle is 0 days (impossible by enum)
-             temp_date = current_date
-             while temp_date <= next_30:
-                 if temp_date >= today:
-                     due_next_30 += float(sub.amount)
-                 temp_date = self._calculate_next_due_date(temp_date, sub.billing_cycle)
+            occurrences = self._count_occurrences(
+                sub.next_due_date, today, next_30, sub.billing_cycle
+            )
+            if occurrences:
+                due_next_30 += occurrences * float(sub.amount)
 
         category_breakdown = [
             CategoryBreakdownItem(name=k, amount=round(v, 2)) 
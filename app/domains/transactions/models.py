@@ -1,4 +1,3 @@
-import uuid
 from datetime import datetime
 from decimal import Decimal
 
@@ -14,6 +13,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
+from app.core.utils.ids import uuid7
 from app.db.connection_and_session import Base
 
 
@@ -21,7 +21,7 @@ class Transaction(Base):
     __tablename__ = "transactions"
 
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
 
     # ==================== SIMPLE APPROACH FIELDS (Currently Active) ====================
     amount = Column(DECIMAL(15, 2), nullable=False)
@@ -100,6 +100,20 @@ class Transaction(Base):
         Index("idx_transactions_vendor_id", "vendor_id"),
         Index("idx_transactions_subscription_id", "subscription_id"),
         Index("idx_transactions_installment_id", "installment_id"),
+        # Trigram indexes (pg_trgm) serve the substring ILIKE filters on
+        # category and description, which a btree cannot
+        Index(
+            "idx_transactions_category_trgm",
+            "category",
+            postgresql_using="gin",
+            postgresql_ops={"category": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_transactions_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
     )
 
     # Relationships - temporarily removed to avoid circular import issues
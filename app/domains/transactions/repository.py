@@ -2,7 +2,7 @@ from datetime import datetime, date
 from typing import List, Optional, Tuple, Dict, Any
 from uuid import UUID
 
-from sqlalchemy import and_, asc, desc, or_, func
+from sqlalchemy import Date, and_, asc, case, cast, desc, or_, func, insert, tuple_
 from sqlalchemy.orm import Session, joinedload
 from decimal import Decimal
 from app.domains.transactions.models import Transaction
@@ -11,6 +11,26 @@ from app.domains.categories.models import UserCategory
 from app.domains.credit_cards.models import CreditCard
 from app.domains.transactions.constants import MovementType
 
+# Amount with its effect on the account balance: add income/investment,
+# subtract expense/transfer
+SIGNED_AMOUNT = case(
+    (Transaction.movement_type == MovementType.INCOME, Transaction.amount),
+    (Transaction.movement_type == MovementType.INVESTMENT, Transaction.amount),
+    else_=-Transaction.amount,
+)
+
+SORT_FIELDS = {
+    "date": Transaction.date,
+    "amount": Transaction.amount,
+    "created_at": Transaction.created_at,
+    "category": Transaction.category,
+}
+
+
+def get_sort_field(filters: TransactionFilters):
+    """Column the list is sorted by (date for unknown sort_by values)"""
+    return SORT_FIELDS.get(filters.sort_by, Transaction.date)
+
 
 class TransactionRepository:
     def __init__(self, db: Session):
@@ -64,8 +84,9 @@ class TransactionRepository:
 
         Benefits:
         - ✅ Maintains repository abstraction layer
-        - ✅ High performance bulk insert via SQLAlchemy
-        - ✅ Single database round-trip
+        - ✅ High performance bulk insert via SQLAlchemy 2.0 executemany
+          (batched multi-row INSERT ... VALUES, no per-row ORM objects)
+        - ✅ IDs are generated by the caller, so no RETURNING is needed
         - ✅ Consistent error handling with rollback
         - ✅ Returns list of created transaction IDs
 
@@ -79,7 +100,10 @@ class TransactionRepository:
             Exception: If bulk insert fails, rolls back transaction
         """
         try:
-            self.db.bulk_insert_mappings(Transaction, transactions_data)
+            if not transactions_data:
+                return []
+
+            self.db.execute(insert(Transaction), transactions_data)
             self.db.commit()
             return [tx_data["id"] for tx_data in transactions_data]
         except Exception as e:
@@ -91,7 +115,7 @@ class TransactionRepository:
         account_id: UUID,
         user_id: UUID,
         filters: Optional[TransactionFilters] = None,
-    ) -> Tuple[List[Transaction], int]:
+    ) -> Tuple[List[Transaction], Optional[int]]:
         """
         Get account transactions using structured filters.
 
@@ -122,19 +146,17 @@ class TransactionRepository:
             query = self._apply_filters(query, filters)
             query = self._apply_sorting(query, filters)
 
-            total_count = query.count()
-            query = self._apply_pagination(query, filters)
-        else:
-            total_count = query.count()
+            return self._fetch_page(query, filters)
 
-        return query.all(), total_count
+        transactions = query.all()
+        return transactions, len(transactions)
 
     def get_account_and_related_credit_card_transactions_with_filters(
         self,
         account_id: UUID,
         user_id: UUID,
         filters: Optional[TransactionFilters] = None,
-    ) -> Tuple[List[Transaction], int]:
+    ) -> Tuple[List[Transaction], Optional[int]]:
         """
         🎓 ENHANCED: Get account transactions AND credit card transactions for cards linked to the account.
 
@@ -187,19 +209,17 @@ class TransactionRepository:
             query = self._apply_filters(query, filters)
             query = self._apply_sorting(query, filters)
 
-            total_count = query.count()
-            query = self._apply_pagination(query, filters)
-        else:
-            total_count = query.count()
+            return self._fetch_page(query, filters)
 
-        return query.all(), total_count
+        transactions = query.all()
+        return transactions, len(transactions)
 
     def get_credit_card_transactions_with_filters(
         self,
         credit_card_id: UUID,
         user_id: UUID,
         filters: Optional[TransactionFilters] = None,
-    ) -> Tuple[List[Transaction], int]:
+    ) -> Tuple[List[Transaction], Optional[int]]:
         # Base query with category and credit_card JOINs
         query = (
             self.db.query(Transaction)
@@ -222,15 +242,10 @@ class TransactionRepository:
         if filters:
             query = self._apply_filters(query, filters)
             query = self._apply_sorting(query, filters)
-            # Get total count before pagination
-            total_count = query.count()
-
-            # Apply pagination
-            query = self._apply_pagination(query, filters)
-        else:
-            total_count = query.count()
+            return self._fetch_page(query, filters)
 
-        return query.all(), total_count
+        transactions = query.all()
+        return transactions, len(transactions)
 
     def _apply_filters(self, query, filters: TransactionFilters):
         """🔧 Private method to build WHERE conditions dynamically"""
@@ -271,36 +286,72 @@ class TransactionRepository:
         return query
 
     def _apply_sorting(self, query, filters: TransactionFilters):
-        sort_fields = {
-            "date": Transaction.date,
-            "amount": Transaction.amount,
-            "created_at": Transaction.created_at,
-            "category": Transaction.category,
-        }
-
-        default_field = Transaction.date
-        field = sort_fields.get(filters.sort_by or default_field, default_field)
+        field = get_sort_field(filters)
 
+        # created_at and id break ties so the order is total, as keyset
+        # pagination requires
         if filters.sort_order == "asc":
-            query = query.order_by(asc(field))
+            query = query.order_by(
+                asc(field), asc(Transaction.created_at), asc(Transaction.id)
+            )
         else:
             # Default to desc, with secondary sort by created_at desc
-            query = query.order_by(desc(field), desc(Transaction.created_at))
+            query = query.order_by(
+                desc(field), desc(Transaction.created_at), desc(Transaction.id)
+            )
 
         return query
 
-    def _apply_pagination(self, query, filters: TransactionFilters):
+    def _apply_pagination(
+        self, query, filters: TransactionFilters, extra_rows: int = 0
+    ):
+        """Apply pagination to query (extra_rows reads past the page end)"""
         page = max(1, filters.page)
         per_page = min(100, max(1, filters.per_page))
 
+        if filters.after_id:
+            # Keyset: seek past the last row seen instead of scanning and
+            # discarding OFFSET rows, in the direction of _apply_sorting
+            sort_key = tuple_(
+                get_sort_field(filters), Transaction.created_at, Transaction.id
+            )
+            after = tuple_(
+                filters.after_sort_value, filters.after_created_at, filters.after_id
+            )
+            if filters.sort_order == "asc":
+                query = query.filter(sort_key > after)
+            else:
+                query = query.filter(sort_key < after)
+            return query.limit(per_page + extra_rows)
+
         offset = (page - 1) * per_page
-        return query.offset(offset).limit(per_page)
+        return query.offset(offset).limit(per_page + extra_rows)
+
+    def _fetch_page(
+        self, query, filters: TransactionFilters
+    ) -> Tuple[List[Transaction], Optional[int]]:
+        """
+        Fetch one page and the total match count.
+
+        Without filters.with_total the COUNT (which makes Postgres visit every
+        match, not just the page) is skipped: the count is None and one row
+        past the page is fetched, so the caller can tell whether a next page
+        exists.
+        """
+        if not filters.with_total:
+            return self._apply_pagination(query, filters, extra_rows=1).all(), None
+
+        # The count covers every match; a keyset page cannot tell from it
+        # whether rows remain past the cursor, so it reads the extra row too
+        total_count = query.count()
+        extra_rows = 1 if filters.after_id else 0
+        return self._apply_pagination(query, filters, extra_rows).all(), total_count
 
     def get_user_transactions_with_filters(
         self,
         user_id: UUID,
         filters: Optional[TransactionFilters] = None,
-    ) -> Tuple[List[Transaction], int]:
+    ) -> Tuple[List[Transaction], Optional[int]]:
         """
         Get all user transactions (from accounts and credit cards) using structured filters.
 
@@ -328,24 +379,24 @@ class TransactionRepository:
             query = self._apply_filters(query, filters)
             query = self._apply_sorting(query, filters)
 
-            total_count = query.count()
-            query = self._apply_pagination(query, filters)
-        else:
-            total_count = query.count()
+            return self._fetch_page(query, filters)
 
-        return query.all(), total_count
+        transactions = query.all()
+        return transactions, len(transactions)
 
-    def get_transactions_for_timeline(
+    def get_daily_balance_movements(
         self, account_id: UUID, user_id: UUID, start_date: date, end_date: date
-    ) -> List[Transaction]:
-        return (
-            self.db.query(Transaction)
-            .options(
-                joinedload(Transaction.category_tree).joinedload(UserCategory.parent),
-                joinedload(Transaction.credit_card),
-                joinedload(Transaction.vendor),
-                joinedload(Transaction.subscription),
-            )
+    ) -> Dict[date, Decimal]:
+        """
+        Net balance movement of each day in the range that has transactions.
+
+        Summed by Postgres (GROUP BY day) with the same signs as
+        get_balance_before_date, instead of loading every transaction with
+        its relations and adding Decimals in Python.
+        """
+        day = cast(Transaction.date, Date)
+        rows = (
+            self.db.query(day, func.sum(SIGNED_AMOUNT))
             .filter(
                 and_(
                     Transaction.account_id == account_id,
@@ -357,9 +408,10 @@ class TransactionRepository:
                     == False,  # Exclude ignored transactions from balance
                 )
             )
-            .order_by(Transaction.date.asc())
+            .group_by(day)
             .all()
         )
+        return {row_day: movement for row_day, movement in rows}
 
     def get_balance_before_date(
         self, account_id: UUID, user_id: UUID, start_date: date
@@ -371,19 +423,8 @@ class TransactionRepository:
         - income: adds to balance
         - expense: subtracts from balance
         """
-        from sqlalchemy import case
-
-        # Sum with conditional: add income/investment, subtract expense/transfer
         total = (
-            self.db.query(
-                func.sum(
-                    case(
-                        (Transaction.movement_type == MovementType.INCOME, Transaction.amount),
-                        (Transaction.movement_type == MovementType.INVESTMENT, Transaction.amount),
-                        else_=-Transaction.amount,
-                    )
-                )
-            )
+            self.db.query(func.sum(SIGNED_AMOUNT))
             .filter(
                 and_(
                     Transaction.account_id == account_id,
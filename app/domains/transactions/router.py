@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_current_user_id
@@ -62,6 +62,12 @@ def get_user_transactions(
     sort_order: Optional[str] = Query(
         "desc", description="Sort order: desc (newest first) or asc"
     ),
+    with_total: bool = Query(
+        True, description="Count all matches (false: meta.total is null, faster)"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="meta.next_cursor of the previous page (overrides page)"
+    ),
     # Dependencies
     db: Session = Depends(get_db_session),
     user_id: UUID = Depends(get_current_user_id),
@@ -106,27 +112,32 @@ def get_user_transactions(
                     # Invalid UUID format - we can either raise 422 or ignore
                     # For filtering, ignoring invalid values or raising 422 is standard.
                     # Let's raise 422 to be strict/helpful.
-                    from fastapi import HTTPException
                     raise HTTPException(status_code=422, detail=f"Invalid UUID format: {uuid_str}")
 
     # Create structured filters from query parameters
-    filters = TransactionFilters(
-        page=page,
-        per_page=per_page,
-        date_from=date_from,
-        date_to=date_to,
-        movement_type=final_movement_type,
-        category=category,
-        category_id=final_category_id,
-        description_contains=description_contains,
-        amount_min=amount_min,
-        amount_max=amount_max,
-        is_paid=is_paid,
-        vendor_id=vendor_id,
-        subscription_id=subscription_id,
-        sort_by=sort_by,
-        sort_order=sort_order,
-    )
+    try:
+        filters = TransactionFilters(
+            page=page,
+            per_page=per_page,
+            date_from=date_from,
+            date_to=date_to,
+            movement_type=final_movement_type,
+            category=category,
+            category_id=final_category_id,
+            description_contains=description_contains,
+            amount_min=amount_min,
+            amount_max=amount_max,
+            is_paid=is_paid,
+            vendor_id=vendor_id,
+            subscription_id=subscription_id,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            with_total=with_total,
+            cursor=cursor,
+        )
+    except ValueError:
+        # Malformed cursor
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
     # Get transactions using the new service method
     service = TransactionService(db)
@@ -1,10 +1,12 @@
 from datetime import datetime
-from typing import List, Optional
+from decimal import Decimal, InvalidOperation
+from typing import List, Optional, Union
 from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 from app.domains.vendors.schemas import VendorResponse
 from app.domains.subscriptions.schemas import SubscriptionResponse
+from app.core.utils.pagination import decode_cursor
 from app.domains.transactions.constants import MovementType
 
 
@@ -195,6 +197,16 @@ class TransactionFilters(BaseModel):
     # Pagination (embedded in filter for convenience)
     page: int = 1
     per_page: int = 20
+    with_total: bool = True  # False: skip the COUNT, meta.total is None
+
+    # Keyset pagination: sort key (sort field, created_at, id) of the last row
+    # already seen. When set, the page starts right after it and `page` is
+    # ignored. Clients pass it as `cursor` (a previous meta.next_cursor),
+    # decoded below
+    cursor: Optional[str] = None
+    after_sort_value: Optional[Union[datetime, Decimal]] = None
+    after_created_at: Optional[datetime] = None
+    after_id: Optional[UUID] = None
 
     @field_validator("movement_type", mode="before")
     @classmethod
@@ -206,14 +218,37 @@ class TransactionFilters(BaseModel):
             return [item.lower() if isinstance(item, str) else item for item in v]
         return v
 
+    @model_validator(mode="after")
+    def unpack_cursor(self):
+        """Unpack `cursor` into the after_* sort key (ValueError if malformed)"""
+        if self.cursor:
+            if self.sort_by == "category":
+                # Nullable column: a row-value comparison never matches NULLs
+                raise ValueError("Cursor pagination does not support sort_by=category")
+
+            sort_part, created_at_part, id_part = decode_cursor(self.cursor, 3)
+            if self.sort_by == "amount":
+                try:
+                    self.after_sort_value = Decimal(sort_part)
+                except InvalidOperation:
+                    raise ValueError(f"Invalid cursor: {self.cursor}")
+            else:
+                self.after_sort_value = datetime.fromisoformat(sort_part)
+            self.after_created_at = datetime.fromisoformat(created_at_part)
+            self.after_id = UUID(id_part)
+        return self
+
 
 # Pagination metadata
 class TransactionListMeta(BaseModel):
-    total: int
+    total: Optional[int] = None
     page: int = 1
     per_page: int = 20
     has_next: bool = False
     has_previous: bool = False
+    # Opaque cursor for the next page (pass back as `cursor`); None when
+    # sorting by category, which only pages by OFFSET
+    next_cursor: Optional[str] = None
 
 
 # Response with pagination
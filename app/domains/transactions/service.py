@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 
 from fastapi import HTTPException
 from app.core.error_handlers import NotFoundError, ValidationError
+from app.core.utils.pagination import encode_cursor
 from app.core.logging_config import get_logger
 from app.domains.accounts.service import AccountService
 from app.domains.balance_points.service import BalancePointService
@@ -16,7 +17,7 @@ from app.domains.vendors.service import VendorService
 from app.domains.subscriptions.service import SubscriptionService
 from app.domains.transactions.constants import MovementType
 from app.domains.transactions.models import Transaction
-from app.domains.transactions.repository import TransactionRepository
+from app.domains.transactions.repository import TransactionRepository, get_sort_field
 from app.domains.transactions.schemas import (
     TransactionBulkRequest,
     TransactionBulkResponse,
@@ -46,15 +47,7 @@ class TransactionService:
     def create_transactions_bulk(
         self, transactions_data: List[Dict[str, Any]]
     ) -> List[UUID]:
-        try:
-            self.db.bulk_insert_mappings(Transaction, transactions_data)
-            self.db.commit()
-            transaction_ids = [tx_data["id"] for tx_data in transactions_data]
-            return transaction_ids
-
-        except Exception as e:
-            self.db.rollback()
-            raise e
+        return self.repository.bulk_create(transactions_data)
 
     def create_transactions_from_data(
         self, transaction_data_list: List[Dict[str, Any]], user_id: UUID
@@ -438,25 +431,14 @@ class TransactionService:
                     )
                 )
 
-            # Calculate pagination metadata
-            total_pages = (total_count + filters.per_page - 1) // filters.per_page
-            has_next = filters.page < total_pages
-            has_previous = filters.page > 1
+            meta = self._build_list_meta(total_count, filters, transactions)
+            transactions = transactions[: filters.per_page]
 
             # Convert to response schemas
             transaction_responses = [
                 TransactionResponse.from_orm(transaction)
                 for transaction in transactions
             ]
-
-            # Create metadata
-            meta = TransactionListMeta(
-                total=total_count,
-                page=filters.page,
-                per_page=filters.per_page,
-                has_next=has_next,
-                has_previous=has_previous,
-            )
             return TransactionListResponse(data=transaction_responses, meta=meta)
 
         except Exception as e:
@@ -493,10 +475,8 @@ class TransactionService:
                 )
             )
 
-            # Calculate pagination metadata
-            total_pages = (total_count + filters.per_page - 1) // filters.per_page
-            has_next = filters.page < total_pages
-            has_previous = filters.page > 1
+            meta = self._build_list_meta(total_count, filters, transactions)
+            transactions = transactions[: filters.per_page]
 
             # Convert to response schemas
             transaction_responses = [
@@ -504,18 +484,9 @@ class TransactionService:
                 for transaction in transactions
             ]
 
-            # Create metadata
-            meta = TransactionListMeta(
-                total=total_count,
-                page=filters.page,
-                per_page=filters.per_page,
-                has_next=has_next,
-                has_previous=has_previous,
-            )
-
             logger.info(
                 f"Retrieved {len(transactions)} transactions for credit card {credit_card_id}, "
-                f"page {filters.page}/{total_pages}"
+                f"page {filters.page} (total {total_count})"
             )
 
             return TransactionListResponse(data=transaction_responses, meta=meta)
@@ -557,10 +528,8 @@ class TransactionService:
                 )
             )
 
-            # Calculate pagination metadata
-            total_pages = (total_count + filters.per_page - 1) // filters.per_page
-            has_next = filters.page < total_pages
-            has_previous = filters.page > 1
+            meta = self._build_list_meta(total_count, filters, transactions)
+            transactions = transactions[: filters.per_page]
 
             # Convert to response schemas
             transaction_responses = [
@@ -568,18 +537,9 @@ class TransactionService:
                 for transaction in transactions
             ]
 
-            # Create metadata
-            meta = TransactionListMeta(
-                total=total_count,
-                page=filters.page,
-                per_page=filters.per_page,
-                has_next=has_next,
-                has_previous=has_previous,
-            )
-
             logger.info(
                 f"Retrieved {len(transactions)} transactions for user {user_id}, "
-                f"page {filters.page}/{total_pages}"
+                f"page {filters.page} (total {total_count})"
             )
 
             return TransactionListResponse(data=transaction_responses, meta=meta)
@@ -588,6 +548,38 @@ class TransactionService:
             logger.error(f"Error retrieving transactions for user {user_id}: {str(e)}")
             raise
 
+    def _build_list_meta(
+        self,
+        total_count: Optional[int],
+        filters: TransactionFilters,
+        transactions: List[Transaction],
+    ) -> TransactionListMeta:
+        if total_count is None or filters.after_id:
+            # Uncounted or keyset page: the repository read one row past the
+            # page end
+            has_next = len(transactions) > filters.per_page
+        else:
+            total_pages = (total_count + filters.per_page - 1) // filters.per_page
+            has_next = filters.page < total_pages
+
+        next_cursor = None
+        page_rows = transactions[: filters.per_page]
+        sort_field = get_sort_field(filters)
+        if has_next and page_rows and sort_field is not Transaction.category:
+            last = page_rows[-1]
+            next_cursor = encode_cursor(
+                getattr(last, sort_field.key), last.created_at.isoformat(), last.id
+            )
+
+        return TransactionListMeta(
+            total=total_count,
+            page=filters.page,
+            per_page=filters.per_page,
+            has_next=has_next,
+            has_previous=filters.page > 1 or bool(filters.after_id),
+            next_cursor=next_cursor,
+        )
+
     def delete_transaction(self, transaction_id: UUID, user_id: UUID) -> bool:
         """
         Delete a single transaction by ID and auto-update balance.
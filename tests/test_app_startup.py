@@ -0,0 +1,17 @@
+"""Smoke tests: the app and its ORM models load."""
+
+from sqlalchemy.orm import configure_mappers
+
+
+def test_app_imports():
+    """Importing app.main registers every router."""
+    from app.main import app
+
+    assert any(route.path.startswith("/api/v1") for route in app.routes)
+
+
+def test_mappers_configure():
+    """Every relationship resolves once all models are imported."""
+    import app.main  # noqa: F401
+
+    configure_mappers()
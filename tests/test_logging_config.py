@@ -0,0 +1,58 @@
+"""Records logged through the background queue keep their structure."""
+
+import json
+import logging
+
+import pytest
+
+from app.core import logging_config
+from app.core.logging_config import clear_request_context, set_request_context
+
+
+@pytest.fixture
+def restore_logging():
+    """Put the root logger back the way the test found it"""
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield
+    logging_config._stop_queue_listener()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+def _json_lines(capsys, logger_name):
+    # Stopping the listener drains the queue
+    logging_config._stop_queue_listener()
+    lines = capsys.readouterr().out.splitlines()
+    entries = [json.loads(line) for line in lines if line.startswith("{")]
+    return [entry for entry in entries if entry["logger"] == logger_name]
+
+
+def test_exception_field_survives_the_queue(capsys, restore_logging):
+    logging_config.setup_logging("production")
+    try:
+        raise RuntimeError("kaboom")
+    except RuntimeError:
+        logging.getLogger("app.tests").exception("boom")
+
+    (entry,) = _json_lines(capsys, "app.tests")
+    assert entry["message"] == "boom"
+    assert entry["exception"].startswith("Traceback")
+    assert "RuntimeError: kaboom" in entry["exception"]
+
+
+def test_request_context_is_captured_on_the_logging_thread(capsys, restore_logging):
+    logging_config.setup_logging("production")
+    request_id = set_request_context(user_id="user-1")
+    try:
+        logging.getLogger("app.tests").info("hello %s", "world")
+    finally:
+        clear_request_context()
+
+    (entry,) = _json_lines(capsys, "app.tests")
+    assert entry["message"] == "hello world"
+    assert entry["request_id"] == request_id
+    assert entry["user_id"] == "user-1"
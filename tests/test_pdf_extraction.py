@@ -0,0 +1,82 @@
+"""PDF text extraction backends."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.domains.statements import pdf_extraction
+from app.domains.statements.pdf_extraction import PdfiumBackend, extract_pdf_text
+
+
+def make_pdf(*page_texts: str) -> bytes:
+    """Minimal PDF with one line of Helvetica text per page."""
+    page_count = len(page_texts)
+    font_id = 3 + 2 * page_count
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids ["
+        + b" ".join(b"%d 0 R" % (3 + 2 * i) for i in range(page_count))
+        + b"] /Count %d >>" % page_count,
+    ]
+    for i, text in enumerate(page_texts):
+        stream = b"BT /F1 12 Tf 72 720 Td (%s) Tj ET" % text.encode()
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>"
+            % (font_id, 4 + 2 * i)
+        )
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        )
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    return pdf
+
+
+def test_extracts_text_of_every_page():
+    pdf = make_pdf("Opening balance 100.00", "Closing balance 80.00")
+
+    text = extract_pdf_text(pdf)
+
+    assert "Opening balance 100.00" in text
+    assert "Closing balance 80.00" in text
+
+
+def test_pdfium_is_never_called_from_two_threads_at_once(monkeypatch):
+    real_page_texts = pdf_extraction._pdfium_page_texts
+    active, peak = 0, 0
+    counter_lock = threading.Lock()
+
+    def tracking_page_texts(*args):
+        nonlocal active, peak
+        with counter_lock:
+            active += 1
+            peak = max(peak, active)
+        try:
+            threading.Event().wait(0.01)
+            return real_page_texts(*args)
+        finally:
+            with counter_lock:
+                active -= 1
+
+    monkeypatch.setattr(pdf_extraction, "_pdfium_page_texts", tracking_page_texts)
+    pdfs = [make_pdf(f"Statement {i}") for i in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(PdfiumBackend().extract_pages, pdfs))
+
+    assert [pages[0].strip() for pages in results] == [
+        f"Statement {i}" for i in range(8)
+    ]
+    assert peak == 1
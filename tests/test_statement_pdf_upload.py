@@ -0,0 +1,101 @@
+"""Error mapping of the PDF statement upload endpoint."""
+
+import asyncio
+from io import BytesIO
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from starlette.datastructures import Headers
+
+from app.core.config import get_settings
+from app.core.dependencies import get_ai_client
+from app.core.error_handlers import NotFoundError, ValidationError
+from app.domains.accounts.service import AccountService
+from app.domains.statements.service import StatementService
+from app.domains.statements.validators import read_pdf_upload
+from app.main import app
+
+URL = "/api/v1/statements/parse-pdf"
+
+
+@pytest.fixture
+def parsed(client, monkeypatch):
+    """Uploads that reach the parser; requests run as the account owner."""
+    uploads = []
+
+    async def parse(self, pdf_content, **kwargs):
+        uploads.append(pdf_content)
+        raise ValueError("stop after the upload checks")
+
+    monkeypatch.setattr(AccountService, "get_owned_account", lambda *args: object())
+    monkeypatch.setattr(StatementService, "parse_pdf_and_create_statement", parse)
+    app.dependency_overrides[get_ai_client] = lambda: None
+    return uploads
+
+
+@pytest.mark.parametrize(
+    "error, status_code",
+    [
+        (NotFoundError(message="Account not found"), 404),
+        (ValidationError(message="Could not extract text from PDF"), 400),
+        (ValueError("Invalid statement data"), 400),
+        (RuntimeError("connection to server lost"), 500),
+    ],
+)
+def test_parse_pdf_maps_service_errors(client, monkeypatch, error, status_code):
+    async def fail(*args, **kwargs):
+        raise error
+
+    monkeypatch.setattr(AccountService, "get_owned_account", lambda *args: object())
+    monkeypatch.setattr(StatementService, "parse_pdf_and_create_statement", fail)
+    app.dependency_overrides[get_ai_client] = lambda: None
+
+    response = client.post(
+        URL,
+        files={"file": ("statement.pdf", b"%PDF-1.4 test", "application/pdf")},
+        data={"account_id": str(uuid4())},
+    )
+
+    assert response.status_code == status_code
+    if status_code == 500:
+        # Internal error details are logged, not returned
+        assert "connection to server lost" not in response.text
+
+
+def test_body_without_pdf_signature_is_rejected(client, parsed):
+    response = client.post(
+        URL,
+        files={"file": ("statement.pdf", b"<html>not a pdf</html>", "application/pdf")},
+        data={"account_id": str(uuid4())},
+    )
+
+    assert response.status_code == 400
+    assert "File is not a valid PDF" in response.text
+    assert parsed == []
+
+
+def test_body_over_the_upload_limit_is_rejected(client, parsed, monkeypatch):
+    monkeypatch.setattr(get_settings(), "MAX_PDF_UPLOAD_BYTES", 64)
+
+    response = client.post(
+        URL,
+        files={"file": ("statement.pdf", b"%PDF-1.4 " + b"x" * 64, "application/pdf")},
+        data={"account_id": str(uuid4())},
+    )
+
+    assert response.status_code == 413
+    assert parsed == []
+
+
+def test_read_is_bounded_when_the_size_is_not_declared():
+    upload = UploadFile(
+        BytesIO(b"%PDF-1.4 " + b"x" * 64),
+        filename="statement.pdf",
+        headers=Headers({"content-type": "application/pdf"}),
+    )
+
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(read_pdf_upload(upload, 64))
+
+    assert excinfo.value.status_code == 413
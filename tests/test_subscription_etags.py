@@ -0,0 +1,90 @@
+"""Conditional requests (ETag / If-None-Match) on the subscription endpoints."""
+
+from datetime import date
+
+import pytest
+
+from app.domains.subscriptions.schemas import SubscriptionCreate
+from app.domains.subscriptions.service import SubscriptionService
+
+URL = "/api/v1/subscriptions"
+
+
+@pytest.fixture
+def subscription_id(db, user_id):
+    return (
+        SubscriptionService(db)
+        .create_subscription(
+            SubscriptionCreate(
+                name="Netflix",
+                amount=39.9,
+                billing_cycle="monthly",
+                next_due_date=date(2026, 1, 15),
+            ),
+            user_id,
+        )
+        .id
+    )
+
+
+@pytest.mark.parametrize("path", ["", "/{id}"])
+def test_body_etag_revalidates_and_upgrades_to_version_etag(
+    client, subscription_id, path
+):
+    url = URL + path.format(id=subscription_id)
+
+    first = client.get(url)
+    body_etag = first.headers["ETag"]
+    assert first.status_code == 200
+
+    # The body ETag still matches, and the 304 carries the version ETag
+    revalidated = client.get(url, headers={"If-None-Match": body_etag})
+    version_etag = revalidated.headers["ETag"]
+    assert revalidated.status_code == 304
+    assert version_etag != body_etag
+
+    cached = client.get(url, headers={"If-None-Match": version_etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == version_etag
+
+
+def test_stale_etag_gets_the_body(client, subscription_id):
+    response = client.get(URL, headers={"If-None-Match": 'W/"stale"'})
+
+    assert response.status_code == 200
+    assert response.json()["data"][0]["id"] == str(subscription_id)
+
+
+def test_write_changes_the_version_etag(client, subscription_id):
+    stale = 'W/"stale"'
+    before = client.get(URL, headers={"If-None-Match": stale}).headers["ETag"]
+
+    client.patch(f"{URL}/{subscription_id}", json={"name": "Netflix Premium"})
+
+    response = client.get(URL, headers={"If-None-Match": before})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != before
+    assert response.json()["data"][0]["name"] == "Netflix Premium"
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"per_page": 5},
+        {"page": 2},
+        {"is_active": True},
+        {"include": "vendor"},
+        {"with_total": False},
+        {"include_summary": True},
+    ],
+)
+def test_each_list_variant_has_its_own_version_etag(client, subscription_id, params):
+    stale = {"If-None-Match": 'W/"stale"'}
+    default_etag = client.get(URL, headers=stale).headers["ETag"]
+
+    response = client.get(URL, params=params, headers=stale)
+    assert response.headers["ETag"] != default_etag
+
+    # The default list's ETag does not validate another variant
+    response = client.get(URL, params=params, headers={"If-None-Match": default_etag})
+    assert response.status_code == 200
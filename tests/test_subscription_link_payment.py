@@ -0,0 +1,122 @@
+"""POST /subscriptions/{id}/link-payment and its conflict rollback."""
+
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import update
+
+from app.core.error_handlers import ValidationError
+from app.domains.subscriptions.models import Subscription
+from app.domains.subscriptions.schemas import SubscriptionCreate
+from app.domains.subscriptions.service import SubscriptionService
+from app.domains.transactions.models import Transaction
+from app.domains.users.models import User
+from app.domains.vendors.models import Vendor
+
+URL = "/api/v1/subscriptions/{id}/link-payment"
+
+
+def _add_transaction(db, user_id):
+    transaction = Transaction(
+        user_id=user_id,
+        account_id=uuid4(),
+        broker_id=uuid4(),
+        date=datetime(2026, 1, 15),
+        amount=Decimal("39.90"),
+        movement_type="expense",
+        description="NETFLIX.COM",
+        is_paid=False,
+        is_deleted=False,
+        ignored=False,
+    )
+    db.add(transaction)
+    db.commit()
+    return transaction.id
+
+
+@pytest.fixture
+def subscription_id(db, user_id):
+    vendor = Vendor(user_id=user_id, name="Netflix")
+    db.add(vendor)
+    db.commit()
+    return (
+        SubscriptionService(db)
+        .create_subscription(
+            SubscriptionCreate(
+                name="Netflix",
+                amount=39.9,
+                billing_cycle="monthly",
+                next_due_date=date(2026, 1, 15),
+                vendor_id=vendor.id,
+            ),
+            user_id,
+        )
+        .id
+    )
+
+
+def test_links_the_transaction_and_advances_the_due_date(
+    client, db, user_id, subscription_id
+):
+    transaction_id = _add_transaction(db, user_id)
+
+    response = client.post(
+        URL.format(id=subscription_id), json={"transaction_id": str(transaction_id)}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["next_due_date"] == "2026-02-15"
+    db.expire_all()
+    transaction = db.get(Transaction, transaction_id)
+    subscription = db.get(Subscription, subscription_id)
+    assert transaction.subscription_id == subscription_id
+    assert transaction.vendor_id == subscription.vendor_id
+    assert transaction.is_paid is True
+    assert subscription.next_due_date == date(2026, 2, 15)
+
+
+def test_another_users_transaction_is_not_found(client, db, subscription_id):
+    other_user = User(id=uuid4(), email="other@example.com", hashed_password="x")
+    db.add(other_user)
+    db.commit()
+    transaction_id = _add_transaction(db, other_user.id)
+
+    response = client.post(
+        URL.format(id=subscription_id), json={"transaction_id": str(transaction_id)}
+    )
+
+    assert response.status_code == 404
+    db.expire_all()
+    assert db.get(Transaction, transaction_id).subscription_id is None
+    assert db.get(Subscription, subscription_id).next_due_date == date(2026, 1, 15)
+
+
+def test_due_date_changed_meanwhile_rolls_the_link_back(
+    db, user_id, subscription_id, monkeypatch
+):
+    transaction_id = _add_transaction(db, user_id)
+    service = SubscriptionService(db)
+    calculate_next_due_date = service._calculate_next_due_date
+
+    def due_date_moved_meanwhile(current_date, cycle):
+        # Another writer moves the due date after it was read
+        db.execute(
+            update(Subscription)
+            .where(Subscription.id == subscription_id)
+            .values(next_due_date=date(2026, 3, 1))
+            .execution_options(synchronize_session=False)
+        )
+        return calculate_next_due_date(current_date, cycle)
+
+    monkeypatch.setattr(service, "_calculate_next_due_date", due_date_moved_meanwhile)
+
+    with pytest.raises(ValidationError) as excinfo:
+        service.link_payment(subscription_id, transaction_id, user_id)
+
+    assert excinfo.value.error_code == "SUBSCRIPTION_CONFLICT"
+    db.expire_all()
+    transaction = db.get(Transaction, transaction_id)
+    assert transaction.subscription_id is None
+    assert transaction.is_paid is False
@@ -0,0 +1,56 @@
+"""Keyset (cursor) pagination of GET /subscriptions."""
+
+from datetime import date
+
+import pytest
+
+from app.domains.subscriptions.schemas import SubscriptionCreate
+from app.domains.subscriptions.service import SubscriptionService
+
+URL = "/api/v1/subscriptions"
+
+
+@pytest.fixture
+def subscription_ids(db, user_id):
+    """Ids of 7 subscriptions, some sharing a due date."""
+    service = SubscriptionService(db)
+    return {
+        service.create_subscription(
+            SubscriptionCreate(
+                name=f"Subscription {i}",
+                amount=10,
+                billing_cycle="monthly",
+                next_due_date=date(2026, 1, 1 + i % 3),
+            ),
+            user_id,
+        ).id
+        for i in range(7)
+    }
+
+
+@pytest.mark.parametrize("with_total", [True, False])
+def test_cursor_round_trip(client, subscription_ids, with_total):
+    ids = []
+    params = {"per_page": 3, "with_total": with_total}
+    while True:
+        meta_and_data = client.get(URL, params=params).json()
+        ids += [row["id"] for row in meta_and_data["data"]]
+        meta = meta_and_data["meta"]
+        if with_total:
+            assert meta["total"] is not None
+        else:
+            assert meta["total"] is None
+        if not meta["has_next"]:
+            assert meta["next_cursor"] is None
+            break
+        params["cursor"] = meta["next_cursor"]
+
+    assert len(ids) == len(set(ids)) == len(subscription_ids)
+    offset_ids = client.get(URL, params={"per_page": 10}).json()["data"]
+    assert ids == [row["id"] for row in offset_ids]
+
+
+def test_invalid_cursor_returns_400(client):
+    response = client.get(URL, params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
@@ -0,0 +1,58 @@
+"""Subscription responses built without validation keep the validated shape."""
+
+import json
+from datetime import date
+
+from app.domains.categories.models import UserCategory
+from app.domains.subscriptions.schemas import SubscriptionCreate, SubscriptionFilters
+from app.domains.subscriptions.service import SubscriptionService
+from app.domains.vendors.models import Vendor
+
+
+def test_list_rows_match_validated_responses(db, user_id):
+    vendor = Vendor(name="Netflix", user_id=user_id)
+    category = UserCategory(name="Streaming", user_id=user_id)
+    db.add_all([vendor, category])
+    db.commit()
+
+    service = SubscriptionService(db)
+    service.create_subscription(
+        SubscriptionCreate(
+            name="Netflix",
+            amount=39.9,
+            billing_cycle="monthly",
+            next_due_date=date(2026, 1, 15),
+            vendor_id=vendor.id,
+            category_id=category.id,
+        ),
+        user_id,
+    )
+    service.create_subscription(
+        SubscriptionCreate(
+            name="Gym", amount=100, billing_cycle="yearly", next_due_date=date(2026, 3, 1)
+        ),
+        user_id,
+    )
+
+    page = service.get_subscriptions(user_id, SubscriptionFilters())
+
+    assert len(page.data) == 2
+    for row in page.data:
+        validated = service.get_subscription_response(row.id, user_id)
+        assert json.loads(row.model_dump_json()) == json.loads(
+            validated.model_dump_json()
+        )
+
+
+def test_list_endpoint_serves_the_documented_schema(client):
+    response = client.get("/api/v1/subscriptions")
+
+    assert response.status_code == 200
+    assert response.json()["data"] == []
+    assert response.headers["ETag"]
+
+    schema = client.get("/openapi.json").json()
+    content = schema["paths"]["/api/v1/subscriptions"]["get"]["responses"]["200"]
+    assert content["content"]["application/json"]["schema"]["$ref"].endswith(
+        "/SubscriptionListResponse"
+    )
@@ -0,0 +1,140 @@
+"""Offset and keyset (cursor) pagination of GET /transactions."""
+
+from datetime import datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.domains.transactions.models import Transaction
+
+URL = "/api/v1/transactions"
+
+
+@pytest.fixture
+def transaction_ids(db, user_id):
+    """Ids of 13 transactions, with ties on date and created_at."""
+    transactions = [
+        Transaction(
+            user_id=user_id,
+            account_id=uuid4(),
+            broker_id=uuid4(),
+            date=datetime(2026, 1, 1 + i % 4),
+            amount=Decimal(10 + i % 3),
+            movement_type="expense",
+            description=f"Transaction {i}",
+            category="Food",
+            is_deleted=False,
+            ignored=False,
+            created_at=datetime(2026, 1, 10, i % 2),
+        )
+        for i in range(13)
+    ]
+    db.add_all(transactions)
+    db.commit()
+    return {transaction.id for transaction in transactions}
+
+
+def _pages(client, per_page=5, **params):
+    """Follow meta.next_cursor from the first page to the last."""
+    pages = []
+    cursor = None
+    while True:
+        query = dict(params, per_page=per_page)
+        if cursor:
+            query["cursor"] = cursor
+        response = client.get(URL, params=query)
+        assert response.status_code == 200
+        pages.append(response.json())
+        cursor = pages[-1]["meta"]["next_cursor"]
+        if not pages[-1]["meta"]["has_next"]:
+            return pages
+        assert cursor
+
+
+def _ids(pages):
+    return [row["id"] for page in pages for row in page["data"]]
+
+
+@pytest.mark.parametrize("sort_by", ["date", "amount", "created_at"])
+@pytest.mark.parametrize("sort_order", ["asc", "desc"])
+def test_cursor_pages_match_offset_pages(client, transaction_ids, sort_by, sort_order):
+    pages = _pages(client, sort_by=sort_by, sort_order=sort_order)
+    ids = _ids(pages)
+
+    # No duplicates or gaps, in the same order as OFFSET paging
+    assert len(ids) == len(set(ids)) == len(transaction_ids)
+    assert {str(id_) for id_ in transaction_ids} == set(ids)
+    offset_ids = []
+    for page in range(1, 4):
+        response = client.get(
+            URL,
+            params={
+                "sort_by": sort_by,
+                "sort_order": sort_order,
+                "page": page,
+                "per_page": 5,
+            },
+        )
+        offset_ids += [row["id"] for row in response.json()["data"]]
+    assert ids == offset_ids
+
+
+def test_last_cursor_page_has_no_next(client, transaction_ids):
+    pages = _pages(client)
+
+    assert [len(page["data"]) for page in pages] == [5, 5, 3]
+    last = pages[-1]["meta"]
+    assert last["has_next"] is False
+    assert last["next_cursor"] is None
+    assert last["has_previous"] is True
+
+
+def test_page_ending_on_the_last_row_has_no_next(client, transaction_ids):
+    pages = _pages(client, per_page=len(transaction_ids))
+
+    assert len(pages) == 1
+    assert len(pages[0]["data"]) == len(transaction_ids)
+    assert pages[0]["meta"]["has_next"] is False
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"cursor": "not-a-cursor"},
+        # Decodes, but holds two values instead of three
+        {"cursor": "MjAyNi0wMS0wMXwx"},
+        # Cursors are not supported when sorting by the nullable category
+        {"cursor": "MjAyNi0wMS0wMXwyMDI2LTAxLTAxfDE", "sort_by": "category"},
+    ],
+)
+def test_invalid_cursor_returns_400(client, params):
+    response = client.get(URL, params=params)
+
+    assert response.status_code == 400
+
+
+def test_category_sort_pages_by_offset_only(client, transaction_ids):
+    response = client.get(URL, params={"sort_by": "category", "per_page": 5})
+
+    meta = response.json()["meta"]
+    assert meta["has_next"] is True
+    assert meta["next_cursor"] is None
+
+
+@pytest.mark.parametrize("page, has_next", [(1, True), (3, False)])
+def test_without_total(client, transaction_ids, page, has_next):
+    response = client.get(
+        URL, params={"with_total": False, "page": page, "per_page": 5}
+    )
+
+    body = response.json()
+    assert body["meta"]["total"] is None
+    assert body["meta"]["has_next"] is has_next
+    assert len(body["data"]) == (5 if has_next else 3)
+
+
+def test_with_total(client, transaction_ids):
+    response = client.get(URL, params={"per_page": 5})
+
+    assert response.json()["meta"]["total"] == len(transaction_ids)